@@ -42,11 +42,14 @@ def main():
         sys.exit(1)
     success("Found ../katha-base")
 
-    # Check for existing symlinks/files
+    # Check for existing symlinks/files (lstat also catches broken symlinks)
     errors = []
     for link_path, _ in SYMLINKS:
-        if Path(link_path).exists() or Path(link_path).is_symlink():
-            errors.append(f"{link_path} already exists")
+        try:
+            os.lstat(link_path)
+        except FileNotFoundError:
+            continue
+        errors.append(f"{link_path} already exists")
 
     if errors:
         for e in errors:
@@ -56,7 +59,7 @@ def main():
 
     # Create symlinks
     for link_path, target in SYMLINKS:
-        Path(link_path).symlink_to(target)
+        os.symlink(target, link_path)
         success(f"Created {link_path} → {target}")
 
     success("All symlinks created!")
@@ -3,7 +3,7 @@
 Analyze visual style images and generate style descriptions for prompts.
 
 Usage:
-    uv run scripts/analyze_styles.py [mode] [style_id]
+    uv run scripts/analyze_styles.py <mode> [style_id] [options]
 
 Modes:
     list    - List all available styles and their images
@@ -13,29 +13,49 @@ Modes:
 Arguments:
     style_id - Optional: analyze only a specific style (e.g., 'red_tree')
 
+Options:
+    --live       - Use concurrent live Gemini calls instead of a batch job
+                   (batch mode is cheaper but may take minutes to complete)
+    --force      - Re-analyze styles even if cached results in .cache/styles/ match
+    --jobs N     - Maximum concurrent live Gemini calls (default: 4)
+    --max-side N - Downscale uploaded images to N pixels on the longest side (default: 1024)
+    --dedupe-distance N
+                 - Drop near-duplicate images whose perceptual hashes differ in at
+                   most N bits, keeping the highest resolution copy (default: 8, -1 disables)
+
 Example:
     uv run scripts/analyze_styles.py list
     uv run scripts/analyze_styles.py analyze
     uv run scripts/analyze_styles.py analyze red_tree
+    uv run scripts/analyze_styles.py analyze red_tree --live
     uv run scripts/analyze_styles.py show
 
 Requirements:
     - GEMINI_API_KEY must be set in .env file
+    - GEMINI_CONCURRENCY / STYLE_IMAGE_MAX_SIDE / STYLE_DEDUPE_DISTANCE optionally override
+      the --jobs / --max-side / --dedupe-distance defaults
     - Style images must exist in ref/styles/ with naming convention {style_id}-{##}.jpg
 """
 
+import io
+import re
 import sys
-import yaml
+import json
+import hashlib
+import time
+import random
+import shutil
+import asyncio
+import argparse
 from pathlib import Path
 from collections import defaultdict
-from google import genai
-from google.genai import types
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
 import os
-from PIL import Image
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Heavy dependencies (google.genai, PIL, yaml, dotenv) are imported inside
+# the analyze code path so that `list` and `show` start quickly.
 
 # Style order from README (order of preference)
 STYLE_ORDER = [
@@ -85,8 +105,74 @@ STYLE_METADATA = {
     },
 }
 
+# Model used for style analysis
+ANALYSIS_MODEL = "gemini-2.0-flash"
+
+# Default number of concurrent Gemini analysis calls (live mode)
+DEFAULT_CONCURRENCY = 4
+
+# Style images are downscaled so their longest side is at most this many
+# pixels before upload (Gemini downsamples large images anyway)
+DEFAULT_MAX_SIDE = 1024
+UPLOAD_JPEG_QUALITY = 85
+
+# Near-duplicate images (e.g. repeat scans of one illustration) are detected
+# with a 64-bit difference hash; images whose hashes differ in at most this
+# many bits are treated as duplicates (negative disables deduplication)
+DEFAULT_DEDUPE_DISTANCE = 8
+DHASH_SIZE = 8
+
+# Retry configuration for rate limits (429) and server errors (5xx):
+# exponential backoff with random jitter between attempts
+RETRY_MAX_ATTEMPTS = 6
+RETRY_MIN_WAIT_SECONDS = 1
+RETRY_MAX_WAIT_SECONDS = 60
+
+# Batch mode polling configuration
+BATCH_POLL_SECONDS = 30
+BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+# Shared analysis instructions, sent as the system instruction so the
+# request prefix is byte-identical for every style
+ANALYSIS_INSTRUCTION = """You analyze illustration images to describe an artist's visual style.
+
+Generate a list of 8-12 specific, actionable style descriptors that could be used as prompts to recreate this visual style. Each descriptor should be a complete phrase that describes one aspect of the style.
+
+Focus on:
+- Color palette and color relationships
+- Line quality and stroke characteristics
+- Texture and surface treatment
+- Composition and framing tendencies
+- Character rendering style (if applicable)
+- Mood and atmosphere
+- Medium/technique appearance (e.g., "watercolor washes", "ink crosshatching")
+- Any distinctive or unique visual signatures
+
+Format your response as a simple bulleted list with one descriptor per line, starting each line with "- ".
+Do not include any preamble or explanation, just the bulleted list.
+Each descriptor should be specific enough to guide an AI image generator.
+
+Example format:
+- Muted earth tones with occasional pops of deep crimson
+- Delicate crosshatching for shadows and texture
+- Slightly elongated figure proportions with oversized eyes
+"""
+
+# Per-style user turn; only the artist and books vary between requests
+ANALYSIS_PROMPT_TEMPLATE = "Analyze these illustration images from {artist}'s work (from: {books})."
+
+# Bump when the analysis prompt changes to invalidate cached results
+PROMPT_VERSION = "v2"
+
 STYLES_YAML_PATH = Path("styles.yaml")
 STYLES_DIR = Path("ref/styles")
+CACHE_DIR = Path(".cache/styles")
+FAILED_LOG_PATH = CACHE_DIR / "failed.log"
 
 
 def collect_style_images():
@@ -96,12 +182,14 @@ def collect_style_images():
     if not STYLES_DIR.exists():
         return styles
 
-    for img_path in sorted(STYLES_DIR.glob("*.jpg")):
+    with os.scandir(STYLES_DIR) as it:
+        names = sorted(entry.name for entry in it if entry.name.endswith(".jpg") and entry.is_file())
+
+    for name in names:
         # Parse style ID from filename (e.g., "red_tree-01.jpg" -> "red_tree")
-        name = img_path.stem
-        if "-" in name:
-            style_id = name.rsplit("-", 1)[0]
-            styles[style_id].append(img_path)
+        dash = name.rfind("-")
+        if dash != -1:
+            styles[name[:dash]].append(STYLES_DIR / name)
 
     return styles
 
@@ -140,85 +228,441 @@ def list_styles():
         print()
 
 
-def analyze_style(client, style_id, image_paths):
+def _build_analysis_prompt(style_id):
+    """Build the short per-style user turn naming the artist and books."""
+    meta = STYLE_METADATA.get(style_id, {})
+    return ANALYSIS_PROMPT_TEMPLATE.format(
+        artist=meta.get("artist", "Unknown artist"),
+        books=", ".join(meta.get("books", ["Unknown book"])),
+    )
+
+
+def _analysis_config():
+    """Request config carrying the shared analysis instruction."""
+    from google.genai import types
+
+    return types.GenerateContentConfig(system_instruction=ANALYSIS_INSTRUCTION)
+
+
+def prepare_image(path, max_side=DEFAULT_MAX_SIDE):
+    """Downscale and JPEG-recompress a style image for upload.
+
+    Args:
+        path: Path to the source image
+        max_side: Maximum width/height in pixels
+
+    Returns:
+        types.Part containing the JPEG bytes
+    """
+    from google.genai import types
+    from PIL import Image
+
+    img = Image.open(path)
+    img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+
+    buf = io.BytesIO()
+    img.convert("RGB").save(buf, format="JPEG", quality=UPLOAD_JPEG_QUALITY)
+    return types.Part.from_bytes(data=buf.getvalue(), mime_type="image/jpeg")
+
+
+def _image_dhash(path):
+    """Compute the difference hash and pixel count of an image.
+
+    Returns:
+        Tuple of (64-bit hash as int, width * height of the original image)
+    """
+    from PIL import Image
+
+    with Image.open(path) as img:
+        pixels = img.width * img.height
+        # Let the JPEG decoder downscale via DCT instead of decoding full size
+        img.draft("L", (DHASH_SIZE * 8, DHASH_SIZE * 8))
+        small = img.convert("L").resize((DHASH_SIZE + 1, DHASH_SIZE), Image.Resampling.LANCZOS)
+
+    data = small.tobytes()
+    bits = 0
+    for row in range(DHASH_SIZE):
+        for col in range(DHASH_SIZE):
+            i = row * (DHASH_SIZE + 1) + col
+            bits = (bits << 1) | (data[i] > data[i + 1])
+    return bits, pixels
+
+
+def dedupe_images(style_id, image_paths, max_distance=DEFAULT_DEDUPE_DISTANCE):
+    """Drop near-identical images from a style, keeping the highest-resolution copy.
+
+    Args:
+        style_id: The style identifier (for logging)
+        image_paths: List of paths to style images
+        max_distance: Maximum hash distance (in bits) for two images to count
+            as duplicates; negative disables deduplication
+
+    Returns:
+        List of kept image paths, in their original order
+    """
+    if max_distance < 0 or len(image_paths) < 2:
+        return image_paths
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        hashes = list(executor.map(_image_dhash, image_paths))
+
+    # Visit images largest first so each duplicate group keeps its best copy
+    kept = {}
+    for i in sorted(range(len(image_paths)), key=lambda i: hashes[i][1], reverse=True):
+        image_hash = hashes[i][0]
+        if all((image_hash ^ other).bit_count() > max_distance for other in kept.values()):
+            kept[i] = image_hash
+
+    dropped = len(image_paths) - len(kept)
+    if dropped:
+        print(f"[{style_id}] Dropped {dropped} near-duplicate image(s)")
+    return [img_path for i, img_path in enumerate(image_paths) if i in kept]
+
+
+def _make_contents(style_id, image_paths, image_parts):
+    """Wrap prepared image parts and the analysis prompt into request contents."""
+    from google.genai import types
+
+    for img_path in image_paths:
+        print(f"[{style_id}]   Loaded: {img_path.name}")
+
+    parts = list(image_parts)
+    parts.append(types.Part.from_text(text=_build_analysis_prompt(style_id)))
+    return [types.Content(role="user", parts=parts)]
+
+
+def _build_contents(style_id, image_paths, max_side=DEFAULT_MAX_SIDE):
+    """Build the multimodal request contents (images + analysis prompt) for a style.
+
+    Images are decoded, resized and encoded in a thread pool (PIL releases
+    the GIL for most of this work).
+    """
+    print(f"[{style_id}] Loading {len(image_paths)} images...")
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        image_parts = list(executor.map(partial(prepare_image, max_side=max_side), image_paths))
+
+    return _make_contents(style_id, image_paths, image_parts)
+
+
+async def _build_contents_async(style_id, image_paths, max_side=DEFAULT_MAX_SIDE):
+    """Async version of _build_contents, preparing images in worker threads."""
+    print(f"[{style_id}] Loading {len(image_paths)} images...")
+
+    image_parts = await asyncio.gather(
+        *[asyncio.to_thread(prepare_image, img_path, max_side) for img_path in image_paths]
+    )
+
+    return _make_contents(style_id, image_paths, image_parts)
+
+
+# A bullet line: "-", "*", "•" or "1." / "1)" followed by the descriptor text
+_BULLET_RE = re.compile(r"^[ \t]*(?:[-*\u2022]|\d+[.)])[ \t]+(.+?)[ \t]*$", re.MULTILINE)
+
+
+def _parse_descriptors(text):
+    """Parse a bulleted or numbered model response into a list of descriptors."""
+    return _BULLET_RE.findall(text)
+
+
+def _is_retryable(error):
+    """Whether a Gemini API error is a rate limit (429) or server error (5xx)."""
+    from google.genai import errors
+
+    return isinstance(error, errors.ServerError) or (isinstance(error, errors.ClientError) and error.code == 429)
+
+
+def _retry_wait(attempt):
+    """Random exponential backoff (seconds) before retrying after the given attempt."""
+    cap = min(RETRY_MAX_WAIT_SECONDS, RETRY_MIN_WAIT_SECONDS * 2 ** attempt)
+    return random.uniform(RETRY_MIN_WAIT_SECONDS, cap)
+
+
+def _call_with_retry(label, fn, **kwargs):
+    """Call a Gemini client method, retrying rate-limit and server errors."""
+    from google.genai import errors
+
+    for attempt in range(1, RETRY_MAX_ATTEMPTS + 1):
+        try:
+            return fn(**kwargs)
+        except errors.APIError as e:
+            if not _is_retryable(e) or attempt == RETRY_MAX_ATTEMPTS:
+                raise
+            wait_time = _retry_wait(attempt)
+            print(f"[{label}] Gemini error {e.code} (attempt {attempt}/{RETRY_MAX_ATTEMPTS}). Waiting {wait_time:.1f}s...")
+            time.sleep(wait_time)
+
+
+async def _call_with_retry_async(label, fn, **kwargs):
+    """Async version of _call_with_retry (uses asyncio.sleep between attempts)."""
+    from google.genai import errors
+
+    for attempt in range(1, RETRY_MAX_ATTEMPTS + 1):
+        try:
+            return await fn(**kwargs)
+        except errors.APIError as e:
+            if not _is_retryable(e) or attempt == RETRY_MAX_ATTEMPTS:
+                raise
+            wait_time = _retry_wait(attempt)
+            print(f"[{label}] Gemini error {e.code} (attempt {attempt}/{RETRY_MAX_ATTEMPTS}). Waiting {wait_time:.1f}s...")
+            await asyncio.sleep(wait_time)
+
+
+def _log_failure(style_id, error):
+    """Append a failed style analysis to the failure log."""
+    FAILED_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(FAILED_LOG_PATH, "a") as f:
+        f.write(f"{datetime.now(timezone.utc).isoformat()} {style_id}: {error}\n")
+
+
+async def analyze_style_async(client, style_id, image_paths, max_side=DEFAULT_MAX_SIDE):
     """Analyze a style's images and generate description prompts.
 
+    Uses client.aio for non-blocking API calls, suitable for parallel analysis.
+
     Args:
         client: Gemini client
         style_id: The style identifier
         image_paths: List of paths to style images
+        max_side: Maximum width/height of uploaded images in pixels
 
     Returns:
         List of style descriptor strings
     """
-    print(f"\nAnalyzing style: {style_id}")
-    print(f"  Loading {len(image_paths)} images...")
+    contents = await _build_contents_async(style_id, image_paths, max_side)
 
-    # Load images
-    contents = []
-    for img_path in image_paths:
-        img = Image.open(img_path)
-        contents.append(img)
-        print(f"    Loaded: {img_path.name}")
+    print(f"[{style_id}] Calling Gemini for style analysis...")
+    response = await _call_with_retry_async(
+        style_id,
+        client.aio.models.generate_content,
+        model=ANALYSIS_MODEL,
+        contents=contents,
+        config=_analysis_config(),
+    )
+
+    descriptors = _parse_descriptors(response.text)
+    print(f"[{style_id}] Generated {len(descriptors)} style descriptors")
+    return descriptors
 
-    # Get metadata
+
+def _style_cache_key(style_id, image_paths, max_side, dedupe_distance):
+    """Compute a cache key from the prompt version, model, upload settings, image bytes and style metadata."""
+    digest = hashlib.sha256()
+    digest.update(PROMPT_VERSION.encode())
+    digest.update(ANALYSIS_MODEL.encode())
+    digest.update(f"{max_side}:{dedupe_distance}".encode())
+    for img_path in image_paths:
+        digest.update(img_path.read_bytes())
     meta = STYLE_METADATA.get(style_id, {})
-    artist = meta.get("artist", "Unknown artist")
-    books = ", ".join(meta.get("books", ["Unknown book"]))
+    digest.update(json.dumps(meta, sort_keys=True).encode())
+    return digest.hexdigest()
 
-    # Build the analysis prompt
-    prompt = f"""Analyze these illustration images from {artist}'s work (from: {books}).
 
-Generate a list of 8-12 specific, actionable style descriptors that could be used as prompts to recreate this visual style. Each descriptor should be a complete phrase that describes one aspect of the style.
+def _read_cached_descriptors(style_id, key):
+    """Return cached descriptors for a style if the cache key matches, else None."""
+    cache_path = CACHE_DIR / f"{style_id}.json"
+    if not cache_path.exists():
+        return None
 
-Focus on:
-- Color palette and color relationships
-- Line quality and stroke characteristics
-- Texture and surface treatment
-- Composition and framing tendencies
-- Character rendering style (if applicable)
-- Mood and atmosphere
-- Medium/technique appearance (e.g., "watercolor washes", "ink crosshatching")
-- Any distinctive or unique visual signatures
+    with open(cache_path) as f:
+        cached = json.load(f)
+    if cached.get("key") != key:
+        return None
+    return cached["descriptors"]
 
-Format your response as a simple bulleted list with one descriptor per line, starting each line with "- ".
-Do not include any preamble or explanation, just the bulleted list.
-Each descriptor should be specific enough to guide an AI image generator.
 
-Example format:
-- Muted earth tones with occasional pops of deep crimson
-- Delicate crosshatching for shadows and texture
-- Slightly elongated figure proportions with oversized eyes
-"""
+def _write_cached_descriptors(style_id, key, descriptors):
+    """Store analyzed descriptors for a style alongside their cache key."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_DIR / f"{style_id}.json", "w") as f:
+        json.dump({"key": key, "descriptors": descriptors}, f, indent=2)
 
-    contents.append(prompt)
 
-    print(f"  Calling Gemini for style analysis...")
-    response = client.models.generate_content(
-        model="gemini-2.0-flash",
-        contents=contents,
-    )
+def _merge_style_entries(styles_data, results):
+    """Merge analyzed descriptors into styles_data.
 
-    # Parse the response into a list of descriptors
-    text = response.text.strip()
-    descriptors = []
-    for line in text.split("\n"):
-        line = line.strip()
-        if line.startswith("- "):
-            descriptors.append(line[2:].strip())
-        elif line.startswith("* "):
-            descriptors.append(line[2:].strip())
-
-    print(f"  Generated {len(descriptors)} style descriptors")
-    return descriptors
+    Returns:
+        Tuple of (styles_data, changed). styles_data is reordered according
+        to STYLE_ORDER when new styles were added.
+    """
+    changed = False
+    added = False
+    for style_id, descriptors in results.items():
+        meta = STYLE_METADATA.get(style_id, {})
+        entry = {
+            "artist": meta.get("artist", "Unknown"),
+            "books": meta.get("books", []),
+            "prompts": descriptors,
+        }
+        if styles_data.get(style_id) != entry:
+            added = added or style_id not in styles_data
+            styles_data[style_id] = entry
+            changed = True
+
+    # Reorder styles_data according to STYLE_ORDER (only needed when styles were added)
+    if added:
+        ordered_data = {}
+        for style_id in STYLE_ORDER:
+            if style_id in styles_data:
+                ordered_data[style_id] = styles_data[style_id]
+        # Add any extra styles at the end
+        for style_id in styles_data:
+            if style_id not in ordered_data:
+                ordered_data[style_id] = styles_data[style_id]
+        styles_data = ordered_data
+
+    return styles_data, changed
+
+
+def _write_styles_yaml(styles_data):
+    """Atomically rewrite styles.yaml (write to a temp file, then rename).
+
+    An interrupted run never leaves a truncated styles.yaml behind.
+
+    Returns:
+        Path to the written styles.yaml
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeDumper
+
+    # Single buffered write; UTF-8 so allow_unicode emits names like "Júlia Sardà" as-is
+    tmp_path = STYLES_YAML_PATH.with_suffix(".yaml.tmp")
+    with open(tmp_path, "w", buffering=1 << 20, encoding="utf-8") as f:
+        yaml.dump(styles_data, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    os.replace(tmp_path, STYLES_YAML_PATH)
+    return STYLES_YAML_PATH
+
+
+async def _analyze_styles_live(client, styles, styles_to_analyze, jobs=DEFAULT_CONCURRENCY, max_side=DEFAULT_MAX_SIDE, on_result=None):
+    """Analyze styles with concurrent live calls.
+
+    Uses asyncio.Semaphore to limit in-flight Gemini calls to `jobs`.
+    Styles that still fail after retries are logged and skipped, so the
+    other styles' results are kept.
 
+    Args:
+        on_result: Optional callable(style_id, descriptors) invoked as soon as
+            each style succeeds. It runs in a worker thread, one call at a time.
+
+    Returns:
+        dict mapping style_id to list of style descriptor strings (successful styles only)
+    """
+    semaphore = asyncio.Semaphore(jobs)
+    result_lock = asyncio.Lock()
+
+    async def bounded(style_id):
+        async with semaphore:
+            try:
+                descriptors = await analyze_style_async(client, style_id, styles[style_id], max_side)
+            except Exception as e:
+                # Log the error but don't crash - return None to indicate failure
+                print(f"[{style_id}] FAILED: {e}")
+                _log_failure(style_id, e)
+                return style_id, None
+        if on_result is not None:
+            # Serialize callbacks so concurrent styles don't interleave file writes
+            async with result_lock:
+                await asyncio.to_thread(on_result, style_id, descriptors)
+        return style_id, descriptors
+
+    # Analyze all styles concurrently (results come back in submission order)
+    results = await asyncio.gather(*[bounded(style_id) for style_id in styles_to_analyze])
+    return {style_id: descriptors for style_id, descriptors in results if descriptors is not None}
+
+
+def _analyze_styles_batch(client, styles, styles_to_analyze, max_side=DEFAULT_MAX_SIDE):
+    """Analyze styles with a single Gemini batch job.
+
+    Submits one inlined request per style, polls until the job finishes,
+    then maps responses back to styles by submission order. Styles whose
+    request failed inside the job are logged and skipped.
 
-def analyze_styles(style_filter=None):
+    Returns:
+        dict mapping style_id to list of style descriptor strings (successful styles only)
+    """
+    from google.genai import types
+
+    requests = [
+        types.InlinedRequest(contents=_build_contents(style_id, styles[style_id], max_side), config=_analysis_config())
+        for style_id in styles_to_analyze
+    ]
+
+    print(f"Submitting batch job with {len(requests)} request(s)...")
+    job = _call_with_retry(
+        "batch",
+        client.batches.create,
+        model=ANALYSIS_MODEL,
+        src=requests,
+        config=types.CreateBatchJobConfig(display_name="katha-style-analysis"),
+    )
+    print(f"Created batch job: {job.name}")
+
+    while job.state.name not in BATCH_DONE_STATES:
+        print(f"  Batch state: {job.state.name} (checking again in {BATCH_POLL_SECONDS}s)")
+        time.sleep(BATCH_POLL_SECONDS)
+        job = _call_with_retry("batch", client.batches.get, name=job.name)
+
+    if job.state.name != "JOB_STATE_SUCCEEDED":
+        raise RuntimeError(f"Batch job {job.name} ended in state {job.state.name}: {job.error}")
+
+    results = {}
+    for style_id, inlined in zip(styles_to_analyze, job.dest.inlined_responses):
+        if inlined.error:
+            print(f"[{style_id}] FAILED: {inlined.error}")
+            _log_failure(style_id, inlined.error)
+            continue
+        if inlined.response is None or not inlined.response.text:
+            error = "Empty or blocked response"
+            print(f"[{style_id}] FAILED: {error}")
+            _log_failure(style_id, error)
+            continue
+        descriptors = _parse_descriptors(inlined.response.text)
+        print(f"[{style_id}] Generated {len(descriptors)} style descriptors")
+        results[style_id] = descriptors
+
+    return results
+
+
+def analyze_styles(
+    style_filter=None,
+    live=False,
+    force=False,
+    jobs=DEFAULT_CONCURRENCY,
+    max_side=DEFAULT_MAX_SIDE,
+    dedupe_distance=DEFAULT_DEDUPE_DISTANCE,
+):
     """Analyze all styles (or a specific one) and write to styles.yaml.
 
+    By default all styles are submitted as one Gemini batch job, which is
+    cheaper for offline bulk analysis. With live=True, styles are analyzed
+    with concurrent live calls instead (useful for single-style debugging).
+
+    Results are cached in .cache/styles/ keyed by a hash of the prompt
+    version, images and metadata, so unchanged styles are not re-analyzed.
+    In live mode styles.yaml is rewritten after each successful style, so an
+    interrupted run keeps everything analyzed so far.
+
     Args:
         style_filter: Optional style ID to analyze only that style
+        live: Use live calls instead of batch mode
+        force: Ignore cached results and re-analyze every style
+        jobs: Maximum concurrent live calls
+        max_side: Maximum width/height of uploaded images in pixels
+        dedupe_distance: Hash distance below which images count as near-duplicates
     """
+    import yaml
+    from google import genai
+
+    # Use the libyaml C loader when available
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
     # Get API key
     api_key = os.environ.get("GEMINI_API_KEY")
     if not api_key:
@@ -235,8 +679,8 @@ def analyze_styles(style_filter=None):
 
     # Load existing styles.yaml if it exists
     if STYLES_YAML_PATH.exists():
-        with open(STYLES_YAML_PATH, "r") as f:
-            styles_data = yaml.safe_load(f) or {}
+        with open(STYLES_YAML_PATH, "r", encoding="utf-8") as f:
+            styles_data = yaml.load(f, Loader=SafeLoader) or {}
     else:
         styles_data = {}
 
@@ -252,36 +696,63 @@ def analyze_styles(style_filter=None):
     print("ANALYZING VISUAL STYLES")
     print("=" * 60)
     print(f"Styles to analyze: {', '.join(styles_to_analyze)}")
-
-    # Analyze each style
-    for style_id in styles_to_analyze:
-        image_paths = styles[style_id]
-        meta = STYLE_METADATA.get(style_id, {})
-
-        descriptors = analyze_style(client, style_id, image_paths)
-        styles_data[style_id] = {
-            "artist": meta.get("artist", "Unknown"),
-            "books": meta.get("books", []),
-            "prompts": descriptors,
-        }
-
-    # Reorder styles_data according to STYLE_ORDER
-    ordered_data = {}
-    for style_id in STYLE_ORDER:
-        if style_id in styles_data:
-            ordered_data[style_id] = styles_data[style_id]
-    # Add any extra styles at the end
-    for style_id in styles_data:
-        if style_id not in ordered_data:
-            ordered_data[style_id] = styles_data[style_id]
-
-    # Write to styles.yaml
-    with open(STYLES_YAML_PATH, "w") as f:
-        yaml.dump(ordered_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    print(f"Mode: {'live' if live else 'batch'}")
+
+    written = False
+
+    def record(results):
+        """Merge results into styles_data and rewrite styles.yaml if anything changed."""
+        nonlocal styles_data, written
+        styles_data, changed = _merge_style_entries(styles_data, results)
+        if changed:
+            _write_styles_yaml(styles_data)
+            written = True
+
+    def record_live(style_id, descriptors):
+        _write_cached_descriptors(style_id, cache_keys[style_id], descriptors)
+        record({style_id: descriptors})
+
+    # Reuse cached results for styles whose images and prompt are unchanged
+    cache_keys = {style_id: _style_cache_key(style_id, styles[style_id], max_side, dedupe_distance) for style_id in styles_to_analyze}
+    cached_results = {}
+    if not force:
+        for style_id in styles_to_analyze:
+            cached = _read_cached_descriptors(style_id, cache_keys[style_id])
+            if cached is not None:
+                print(f"[{style_id}] Unchanged, using cached descriptors")
+                cached_results[style_id] = cached
+    record(cached_results)
+    uncached = [style_id for style_id in styles_to_analyze if style_id not in cached_results]
+
+    if uncached:
+        # Drop near-duplicate scans before uploading (cache keys cover all images)
+        for style_id in uncached:
+            styles[style_id] = dedupe_images(style_id, styles[style_id], dedupe_distance)
+
+        if live:
+            # Each style is cached and written to styles.yaml as soon as it succeeds
+            analyzed = asyncio.run(
+                _analyze_styles_live(client, styles, uncached, jobs, max_side, on_result=record_live)
+            )
+        else:
+            # Batch results all arrive together, so write them once
+            analyzed = _analyze_styles_batch(client, styles, uncached, max_side)
+            for style_id, descriptors in analyzed.items():
+                _write_cached_descriptors(style_id, cache_keys[style_id], descriptors)
+            record(analyzed)
+
+        failed = [style_id for style_id in uncached if style_id not in analyzed]
+        if failed:
+            print()
+            print(f"SUMMARY: {len(failed)}/{len(uncached)} style(s) failed: {', '.join(failed)}")
+            print(f"See {FAILED_LOG_PATH} for details. Successful styles are still written.")
 
     print()
     print("=" * 60)
-    print(f"Wrote style descriptions to {STYLES_YAML_PATH}")
+    if written:
+        print(f"Wrote style descriptions to {STYLES_YAML_PATH}")
+    else:
+        print(f"{STYLES_YAML_PATH} is already up to date")
     print("=" * 60)
 
 
@@ -292,35 +763,71 @@ def show_styles():
         print("Run 'uv run scripts/analyze_styles.py analyze' to generate it.")
         return
 
-    with open(STYLES_YAML_PATH, "r") as f:
-        content = f.read()
-
     print("=" * 60)
     print(f"CONTENTS OF {STYLES_YAML_PATH}")
     print("=" * 60)
     print()
-    print(content)
+    sys.stdout.flush()
+
+    # Stream the raw bytes straight to stdout (no decode, constant memory)
+    with open(STYLES_YAML_PATH, "rb") as f:
+        shutil.copyfileobj(f, sys.stdout.buffer)
+    sys.stdout.buffer.flush()
+    print()
+
+
+def _analyze_command(args):
+    """Handle the analyze subcommand."""
+    from dotenv import load_dotenv
+
+    # Load environment variables (GEMINI_API_KEY) from .env file
+    load_dotenv()
+    analyze_styles(args.style_id, args.live, args.force, args.jobs, args.max_side, args.dedupe_distance)
 
 
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        print(__doc__)
-        sys.exit(1)
-
-    mode = sys.argv[1]
-    style_filter = sys.argv[2] if len(sys.argv) > 2 else None
-
-    if mode == "list":
-        list_styles()
-    elif mode == "analyze":
-        analyze_styles(style_filter)
-    elif mode == "show":
-        show_styles()
-    else:
-        print(f"Error: Invalid mode '{mode}'. Must be 'list', 'analyze', or 'show'")
-        print(__doc__)
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Analyze visual style images and generate style descriptions for prompts.",
+    )
+
+    subparsers = parser.add_subparsers(dest="mode", required=True, help="Operation mode")
+
+    # list subcommand
+    subparsers.add_parser("list", help="List all available styles and their images")
+
+    # analyze subcommand
+    analyze_parser = subparsers.add_parser("analyze", help="Analyze style images and write descriptions to styles.yaml")
+    analyze_parser.add_argument("style_id", nargs="?", help="Analyze only this style (e.g., 'red_tree')")
+    analyze_parser.add_argument("--live", action="store_true", help="Use concurrent live calls instead of a batch job")
+    analyze_parser.add_argument("--force", action="store_true", help="Re-analyze styles even if cached results match")
+    analyze_parser.add_argument(
+        "--jobs", "-j", type=int,
+        default=int(os.environ.get("GEMINI_CONCURRENCY", DEFAULT_CONCURRENCY)),
+        help=f"Maximum concurrent live calls (default: $GEMINI_CONCURRENCY or {DEFAULT_CONCURRENCY})",
+    )
+    analyze_parser.add_argument(
+        "--max-side", type=int,
+        default=int(os.environ.get("STYLE_IMAGE_MAX_SIDE", DEFAULT_MAX_SIDE)),
+        help=f"Downscale uploaded images to this many pixels (default: $STYLE_IMAGE_MAX_SIDE or {DEFAULT_MAX_SIDE})",
+    )
+    analyze_parser.add_argument(
+        "--dedupe-distance", type=int,
+        default=int(os.environ.get("STYLE_DEDUPE_DISTANCE", DEFAULT_DEDUPE_DISTANCE)),
+        help=f"Treat images whose perceptual hashes differ in at most this many bits as duplicates; -1 disables (default: $STYLE_DEDUPE_DISTANCE or {DEFAULT_DEDUPE_DISTANCE})",
+    )
+
+    # show subcommand
+    subparsers.add_parser("show", help="Show the current styles.yaml content")
+
+    args = parser.parse_args()
+
+    handlers = {
+        "list": lambda args: list_styles(),
+        "analyze": _analyze_command,
+        "show": lambda args: show_styles(),
+    }
+    handlers[args.mode](args)
 
 
 if __name__ == "__main__":
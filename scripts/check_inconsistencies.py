@@ -7,59 +7,266 @@ This script validates:
 2. Image naming conventions ({id}-{NN}.jpg format)
 3. File inventory (required directories and documentation files)
 4. Cross-references between YAML files (characters, locations, attempts)
-5. YAML structure consistency (required fields)
+5. YAML structure consistency (required fields, plain-string visual fields)
 6. Naming conventions (YAML and image files)
 7. Reference images for all locations and characters
+
+Usage:
+    uv run python scripts/check_inconsistencies.py [--quiet]
+
+Options:
+    --quiet, -q - Only report problems and summaries (omit the ✓ lines)
 """
 
 import yaml
 import sys
+import argparse
 import re
+import os
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Use the libyaml C loader when available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# YAML file names: lowercase with underscores
+YAML_NAME_PATTERN = re.compile(r'[a-z][a-z0-9_]*\.yaml')
+
+# Image file names: id-XX.jpg, where id can contain hyphens for multi-word names
+IMAGE_NAME_PATTERN = re.compile(r'[a-z][a-z0-9_-]*-\d{2}\.jpg')
+
+# An {id}-{NN}.jpg image name, capturing its ID and number
+# (e.g. "dining_room-01.jpg" -> id "dining_room", num "01")
+IMAGE_ID_PATTERN = re.compile(r'(?P<id>.+)-(?P<num>\d{2})\.jpg')
+
+# A name_NN.jpg image name (underscore instead of dash before the number)
+UNDERSCORE_NUMBER_PATTERN = re.compile(r'(?P<id>.*)_(?P<num>\d+)\.jpg')
+
+# Reference image directories (all paths under ref/ derive from REF_ROOT)
+REF_ROOT = 'ref'
+REF_CHARACTERS_DIR = f'{REF_ROOT}/characters'
+REF_LOCATIONS_DIR = f'{REF_ROOT}/locations'
+REF_OBJECTS_DIR = f'{REF_ROOT}/objects'
+REF_STYLES_DIR = f'{REF_ROOT}/styles'
+
+# Directories the project is expected to have, with descriptions
+REQUIRED_DIRS = {
+    'characters': 'Character YAML files',
+    'locations': 'Location YAML files',
+    'story': 'Story template and overview',
+    REF_ROOT: 'Reference images',
+    REF_CHARACTERS_DIR: 'Character reference images',
+    REF_LOCATIONS_DIR: 'Location reference images',
+    REF_OBJECTS_DIR: 'Object reference images',
+    'out': 'Generated outputs',
+    'out/images': 'Generated illustrations',
+    'out/story': 'Generated story files',
+}
+
+# Reference image directories checked for {id}-{NN}.jpg naming
+REF_IMAGE_DIRS = [REF_LOCATIONS_DIR, REF_CHARACTERS_DIR, REF_OBJECTS_DIR, REF_STYLES_DIR]
+
+# Set by --quiet: omit per-item success lines from the report
+QUIET = False
+
+# Threads used to parse YAML files (libyaml releases the GIL while parsing)
+YAML_LOAD_WORKERS = 8
+
+# Number of image names listed per ID in the reference image report
+MAX_IMAGE_SAMPLES = 3
+
+
+def _report_ok(out, line):
+    """Add a success line to a check's report (omitted with --quiet)."""
+    if not QUIET:
+        out.append(line)
+
+
+@lru_cache(maxsize=None)
+def _list_files(directory, suffix):
+    """List the names of regular files in a directory ending with suffix.
+
+    Listings are cached, so each directory is scanned at most once per run.
+    A missing directory lists as empty.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            # DirEntry.is_file() uses the type from the directory read (no extra stat)
+            return tuple(e.name for e in entries if e.name.endswith(suffix) and e.is_file())
+    except FileNotFoundError:
+        return ()
+
+
+def _present_dirs(dir_paths):
+    """Return the subset of dir_paths (like 'ref/characters') that exist as directories.
+
+    Each parent directory is scanned once, instead of stat-ing every path.
+    """
+    present = set()
+    for parent in {d.rpartition('/')[0] or '.' for d in dir_paths}:
+        try:
+            with os.scandir(parent) as entries:
+                subdirs = [e.name for e in entries if e.is_dir()]
+        except FileNotFoundError:
+            continue
+        prefix = '' if parent == '.' else f'{parent}/'
+        present.update(prefix + name for name in subdirs)
+    return present & set(dir_paths)
+
+
+def _list_yaml(directory):
+    """Stems of the YAML files in a directory (e.g. 'arthur' for arthur.yaml)."""
+    return tuple(name[:-len('.yaml')] for name in _list_files(directory, '.yaml'))
+
+
+def _list_jpg(directory):
+    """Names of the JPEG images in a directory."""
+    return _list_files(directory, '.jpg')
+
+
+def _load_yaml(yaml_file, syntax_only=False):
+    """Load one YAML file, or only check its syntax when syntax_only is set.
+
+    Returns:
+        Tuple of (data, error): data is None for syntax-only files, error is
+        None when the file is well-formed (and, unless syntax_only, a mapping).
+    """
+    try:
+        # Read the whole (small) file in one call; the loader decodes the bytes
+        content = yaml_file.read_bytes()
+        if syntax_only:
+            for _ in yaml.parse(content, Loader=SafeLoader):
+                pass
+            return None, None
+        data = yaml.load(content, Loader=SafeLoader)
+    except yaml.YAMLError as e:
+        # Parsing from bytes labels positions "<byte string>"; point them at the file
+        return None, str(e).replace('"<byte string>"', f'"{yaml_file}"')
+    except FileNotFoundError:
+        return None, "File not found"
+
+    # Later checks read fields from character and location files, so anything
+    # other than a mapping (e.g. an empty file) is reported here and skipped there
+    if not isinstance(data, dict):
+        return None, f"expected a mapping at the top level, got {type(data).__name__}"
+    return data, None
+
+
+def load_all_yaml():
+    """Parse every YAML file the checks need, once.
+
+    Character and location files are fully loaded because later checks read
+    their fields. The story template and generated story files are only
+    checked for well-formedness, so they are streamed through the parser
+    without building Python objects and cached as None.
+
+    Returns:
+        Tuple of (yaml_files, yaml_cache, yaml_errors): yaml_files lists every
+        file in discovery order, yaml_cache maps each well-formed file's Path
+        to its parsed data, yaml_errors maps each file that could not be
+        loaded to an error message.
+    """
+    data_files = (
+        [Path('characters', f"{stem}.yaml") for stem in _list_yaml('characters')] +
+        [Path('locations', f"{stem}.yaml") for stem in _list_yaml('locations')]
+    )
+    syntax_only_files = (
+        [Path('story/template.yaml')] +
+        [Path('out/story', f"{stem}.yaml") for stem in _list_yaml('out/story')]
+    )
+
+    yaml_files = data_files + syntax_only_files
+    syntax_only = [False] * len(data_files) + [True] * len(syntax_only_files)
 
+    # Parse files concurrently; map() keeps results in discovery order
+    with ThreadPoolExecutor(max_workers=YAML_LOAD_WORKERS) as executor:
+        results = list(executor.map(_load_yaml, yaml_files, syntax_only))
 
-def validate_yaml_files():
+    yaml_cache = {}
+    yaml_errors = {}
+    for yaml_file, (data, error) in zip(yaml_files, results):
+        if error is None:
+            yaml_cache[yaml_file] = data
+        else:
+            yaml_errors[yaml_file] = error
+    return yaml_files, yaml_cache, yaml_errors
+
+
+def _yaml_in(yaml_cache, directory):
+    """Yield (path, data) for the cached YAML files directly inside a directory."""
+    for path, data in yaml_cache.items():
+        if path.parent == Path(directory):
+            yield path, data
+
+
+@dataclass(frozen=True)
+class CheckContext:
+    """Filesystem and YAML state shared by all checks, built once per run."""
+
+    dirs_present: set          # Expected directories that exist (see _present_dirs)
+    character_ids: frozenset   # Character IDs (YAML file stems)
+    location_ids: frozenset    # Location IDs (YAML file stems)
+    yaml_files: list           # Every YAML file checked, in discovery order
+    yaml_cache: dict           # Path -> parsed data of well-formed YAML files
+    yaml_errors: dict          # Path -> error message of files that failed to load
+    characters: list           # (Path, data) of each well-formed character YAML
+    locations: list            # (Path, data) of each well-formed location YAML
+
+
+def build_context():
+    """Scan the directories and parse the YAML files the checks need, once."""
+    yaml_files, yaml_cache, yaml_errors = load_all_yaml()
+    return CheckContext(
+        dirs_present=_present_dirs([*REQUIRED_DIRS, *REF_IMAGE_DIRS]),
+        character_ids=frozenset(_list_yaml('characters')),
+        location_ids=frozenset(_list_yaml('locations')),
+        yaml_files=yaml_files,
+        yaml_cache=yaml_cache,
+        yaml_errors=yaml_errors,
+        characters=list(_yaml_in(yaml_cache, 'characters')),
+        locations=list(_yaml_in(yaml_cache, 'locations')),
+    )
+
+
+def validate_yaml_files(ctx):
     """Validate all YAML files are well-formed."""
-    print("=" * 60)
-    print("YAML VALIDATION")
-    print("=" * 60)
+    out = []
+    out.append("=" * 60)
+    out.append("YAML VALIDATION")
+    out.append("=" * 60)
 
     errors = []
-    yaml_files = (
-        list(Path('characters').glob('*.yaml')) +
-        list(Path('locations').glob('*.yaml')) +
-        [Path('story/template.yaml')] +
-        list(Path('out/story').glob('*.yaml'))
-    )
+    yaml_files = ctx.yaml_files
 
     for yaml_file in yaml_files:
-        try:
-            with open(yaml_file, 'r') as f:
-                data = yaml.safe_load(f)
-            print(f"✓ {yaml_file}")
-        except yaml.YAMLError as e:
-            error_msg = f"✗ {yaml_file}: {e}"
-            errors.append(error_msg)
-            print(error_msg)
-        except FileNotFoundError:
-            error_msg = f"✗ {yaml_file}: File not found"
+        if yaml_file in ctx.yaml_errors:
+            error_msg = f"✗ {yaml_file}: {ctx.yaml_errors[yaml_file]}"
             errors.append(error_msg)
-            print(error_msg)
+            out.append(error_msg)
+        else:
+            _report_ok(out, f"✓ {yaml_file}")
 
     if errors:
-        print(f"\n❌ {len(errors)} YAML validation error(s) found")
-        return False
+        out.append(f"\n❌ {len(errors)} YAML validation error(s) found")
     else:
-        print(f"\n✅ All {len(yaml_files)} YAML files are well-formed")
-        return True
+        out.append(f"\n✅ All {len(yaml_files)} YAML files are well-formed")
+
+    sys.stdout.write('\n'.join(out) + '\n')
+    return not errors
 
 
-def check_image_naming():
+def check_image_naming(ctx):
     """Check image naming conventions (should be {id}-{NN}.jpg with underscore in ID preserved)."""
-    print("\n" + "=" * 60)
-    print("IMAGE NAMING CONVENTION CHECK")
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("IMAGE NAMING CONVENTION CHECK")
+    out.append("=" * 60)
 
     issues = []
 
@@ -67,133 +274,160 @@ def check_image_naming():
     # Valid: dorje_legpa-01.jpg, dining_room-02.jpg, arthur-01.jpg
     # Invalid: dorje_legpa_01.jpg (underscore before number), dorje-legpa-01.jpg (dash in id)
 
-    for ref_dir in ['ref/locations', 'ref/characters', 'ref/objects', 'ref/styles']:
-        if not Path(ref_dir).exists():
+    for ref_dir in REF_IMAGE_DIRS:
+        if ref_dir not in ctx.dirs_present:
             continue
 
-        print(f"\n{ref_dir}:")
-        for img in sorted(Path(ref_dir).glob('*.jpg')):
+        out.append(f"\n{ref_dir}:")
+        img_names = _list_jpg(ref_dir)
+        existing = frozenset(img_names)
+        for img_name in sorted(img_names):
             # Check if pattern is name_NN.jpg (underscore before number - wrong)
-            if '_' in img.stem:
-                parts = img.stem.rsplit('_', 1)
-                if len(parts) == 2 and parts[1].isdigit():
-                    expected = f"{parts[0]}-{parts[1]}.jpg"
-                    issue = f"  ✗ {img.name}: should be {expected} (use dash before number)"
-                    print(issue)
-                    issues.append(issue)
-                    continue
-
+            underscore_match = UNDERSCORE_NUMBER_PATTERN.fullmatch(img_name)
+            if underscore_match:
+                expected = f"{underscore_match['id']}-{underscore_match['num']}.jpg"
+                issue = f"  ✗ {img_name}: should be {expected} (use dash before number)"
+                if expected in existing:
+                    # Renaming would overwrite another image
+                    issue += f" - but {expected} already exists"
+                out.append(issue)
+                issues.append(issue)
             # Check the image matches the expected pattern
-            parts = img.stem.rsplit('-', 1)
-            if len(parts) != 2 or not parts[1].isdigit() or len(parts[1]) != 2:
-                issue = f"  ✗ {img.name}: doesn't match pattern {{id}}-{{NN}}.jpg"
-                print(issue)
+            elif not IMAGE_ID_PATTERN.fullmatch(img_name):
+                issue = f"  ✗ {img_name}: doesn't match pattern {{id}}-{{NN}}.jpg"
+                out.append(issue)
                 issues.append(issue)
             else:
-                print(f"  ✓ {img.name}")
+                _report_ok(out, f"  ✓ {img_name}")
 
     if issues:
-        print(f"\n❌ {len(issues)} image naming issue(s) found")
-        return False
+        out.append(f"\n❌ {len(issues)} image naming issue(s) found")
     else:
-        print("\n✅ All images follow naming conventions")
-        return True
+        out.append("\n✅ All images follow naming conventions")
+
+    sys.stdout.write('\n'.join(out) + '\n')
+    return not issues
+
+
+def _image_id(img_name):
+    """Extract the ID from an {id}-{NN}.jpg image name, or None if the name doesn't match."""
+    match = IMAGE_ID_PATTERN.fullmatch(img_name)
+    return match.group('id') if match else None
 
 
-def check_reference_images():
+def _character_image_id(img_name):
+    """Image ID with hyphens converted to underscores to match character ID format."""
+    img_id = _image_id(img_name)
+    return img_id.replace('-', '_') if img_id else None
+
+
+def _count_images(img_names, to_id):
+    """Count images per ID, keeping only the first few names of each for display.
+
+    Args:
+        img_names: Image file names
+        to_id: Callable mapping an image file name to its ID (None skips the image)
+
+    Returns:
+        Tuple of (Counter of ID -> image count, dict of ID -> sample image names)
+    """
+    counts = Counter()
+    samples = {}
+    for img_name in img_names:
+        img_id = to_id(img_name)
+        if img_id is None:
+            continue
+        counts[img_id] += 1
+        if counts[img_id] <= MAX_IMAGE_SAMPLES:
+            samples.setdefault(img_id, []).append(img_name)
+    return counts, samples
+
+
+@lru_cache(maxsize=None)
+def _image_index(ref_dir):
+    """Image counts and sample names per ID for a reference directory.
+
+    Cached, so the reference image and naming convention checks share one
+    index per directory. Character image IDs are normalized to use
+    underscores like character YAML IDs.
+    """
+    to_id = _character_image_id if ref_dir == REF_CHARACTERS_DIR else _image_id
+    return _count_images(_list_jpg(ref_dir), to_id)
+
+
+def _image_summary(counts, samples, img_id):
+    """Format an ID's image count and sample names, e.g. '4 image(s) - a-01.jpg, a-02.jpg, a-03.jpg, ...'."""
+    names = ', '.join(samples[img_id])
+    if counts[img_id] > len(samples[img_id]):
+        names += ', ...'
+    return f"{counts[img_id]} image(s) - {names}"
+
+
+def check_reference_images(ctx):
     """Check that all locations and characters have reference images."""
-    print("\n" + "=" * 60)
-    print("REFERENCE IMAGE VERIFICATION")
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("REFERENCE IMAGE VERIFICATION")
+    out.append("=" * 60)
 
     issues = []
 
     # Check locations
-    print("\nLocations:")
-    location_files = list(Path('locations').glob('*.yaml'))
-    location_images = defaultdict(list)
+    out.append("\nLocations:")
+    location_counts, location_samples = _image_index(REF_LOCATIONS_DIR)
 
-    if Path('ref/locations').exists():
-        for img in Path('ref/locations').glob('*.jpg'):
-            # Extract location name from image filename (e.g., "dining_room-01.jpg" -> "dining_room")
-            location_name = img.stem.rsplit('-', 1)[0]
-            location_images[location_name].append(img.name)
-
-    for location_file in location_files:
+    for location_file, data in ctx.locations:
         location_id = location_file.stem
-        with open(location_file, 'r') as f:
-            data = yaml.safe_load(f)
-            display_name = data.get('display_name', location_id)
+        display_name = data.get('display_name', location_id)
 
-        if location_id in location_images:
-            print(f"  ✓ {location_id}: {len(location_images[location_id])} image(s) - {', '.join(location_images[location_id])}")
+        if location_id in location_counts:
+            _report_ok(out, f"  ✓ {location_id}: {_image_summary(location_counts, location_samples, location_id)}")
         else:
             issue = f"  ✗ {location_id} ({display_name}): No reference images found"
-            print(issue)
+            out.append(issue)
             issues.append(issue)
 
     # Check characters
-    print("\nCharacters:")
-    character_files = list(Path('characters').glob('*.yaml'))
-    character_images = defaultdict(list)
-
-    if Path('ref/characters').exists():
-        for img in Path('ref/characters').glob('*.jpg'):
-            # Extract character name from image filename (e.g., "arthur-01.jpg" -> "arthur")
-            # Convert hyphens to underscores to match character ID format
-            character_name = img.stem.rsplit('-', 1)[0].replace('-', '_')
-            character_images[character_name].append(img.name)
-
-    for character_file in character_files:
+    out.append("\nCharacters:")
+    character_counts, character_samples = _image_index(REF_CHARACTERS_DIR)
+
+    for character_file, data in ctx.characters:
         character_id = character_file.stem
-        with open(character_file, 'r') as f:
-            data = yaml.safe_load(f)
-            display_name = data.get('name', character_id)
+        display_name = data.get('name', character_id)
 
-        if character_id in character_images:
-            print(f"  ✓ {character_id}: {len(character_images[character_id])} image(s) - {', '.join(character_images[character_id])}")
+        if character_id in character_counts:
+            _report_ok(out, f"  ✓ {character_id}: {_image_summary(character_counts, character_samples, character_id)}")
         else:
             issue = f"  ✗ {character_id} ({display_name}): No reference images found"
-            print(issue)
+            out.append(issue)
             issues.append(issue)
 
     if issues:
-        print(f"\n❌ {len(issues)} missing reference image(s)")
-        return False
+        out.append(f"\n❌ {len(issues)} missing reference image(s)")
     else:
-        print(f"\n✅ All locations and characters have reference images")
-        return True
+        out.append(f"\n✅ All locations and characters have reference images")
 
+    sys.stdout.write('\n'.join(out) + '\n')
+    return not issues
 
-def check_file_inventory():
+
+def check_file_inventory(ctx):
     """Check that expected directories and key files exist."""
-    print("\n" + "=" * 60)
-    print("FILE INVENTORY")
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("FILE INVENTORY")
+    out.append("=" * 60)
 
     issues = []
 
     # Check required directories
-    required_dirs = {
-        'characters': 'Character YAML files',
-        'locations': 'Location YAML files',
-        'story': 'Story template and overview',
-        'ref': 'Reference images',
-        'ref/characters': 'Character reference images',
-        'ref/locations': 'Location reference images',
-        'ref/objects': 'Object reference images',
-        'out': 'Generated outputs',
-        'out/images': 'Generated illustrations',
-        'out/story': 'Generated story files',
-    }
-
-    print("\nChecking directories:")
-    for dir_path, description in required_dirs.items():
-        if Path(dir_path).exists():
-            print(f"  ✓ {dir_path}/ ({description})")
+    out.append("\nChecking directories:")
+    for dir_path, description in REQUIRED_DIRS.items():
+        if dir_path in ctx.dirs_present:
+            _report_ok(out, f"  ✓ {dir_path}/ ({description})")
         else:
             issue = f"  ✗ Missing directory: {dir_path}/ ({description})"
-            print(issue)
+            out.append(issue)
             issues.append(issue)
 
     # Check key documentation files
@@ -204,346 +438,272 @@ def check_file_inventory():
         '.claude/claude.md': 'Claude context documentation',
     }
 
-    print("\nChecking key files:")
+    out.append("\nChecking key files:")
     for file_path, description in required_files.items():
         if Path(file_path).exists():
-            print(f"  ✓ {file_path} ({description})")
+            _report_ok(out, f"  ✓ {file_path} ({description})")
         else:
             issue = f"  ✗ Missing file: {file_path} ({description})"
-            print(issue)
+            out.append(issue)
             issues.append(issue)
 
     # Report file counts
-    print("\nFile counts:")
-    print(f"  Characters: {len(list(Path('characters').glob('*.yaml')))} YAML files")
-    print(f"  Locations: {len(list(Path('locations').glob('*.yaml')))} YAML files")
-    if Path('ref/characters').exists():
-        print(f"  Character images: {len(list(Path('ref/characters').glob('*.jpg')))} files")
-    if Path('ref/locations').exists():
-        print(f"  Location images: {len(list(Path('ref/locations').glob('*.jpg')))} files")
-    if Path('ref/objects').exists():
-        print(f"  Object images: {len(list(Path('ref/objects').glob('*.jpg')))} files")
+    out.append("\nFile counts:")
+    out.append(f"  Characters: {len(_list_yaml('characters'))} YAML files")
+    out.append(f"  Locations: {len(_list_yaml('locations'))} YAML files")
+    if REF_CHARACTERS_DIR in ctx.dirs_present:
+        out.append(f"  Character images: {len(_list_jpg(REF_CHARACTERS_DIR))} files")
+    if REF_LOCATIONS_DIR in ctx.dirs_present:
+        out.append(f"  Location images: {len(_list_jpg(REF_LOCATIONS_DIR))} files")
+    if REF_OBJECTS_DIR in ctx.dirs_present:
+        out.append(f"  Object images: {len(_list_jpg(REF_OBJECTS_DIR))} files")
 
     if issues:
-        print(f"\n❌ {len(issues)} file inventory issue(s) found")
-        return False
+        out.append(f"\n❌ {len(issues)} file inventory issue(s) found")
     else:
-        print("\n✅ All expected directories and files present")
-        return True
+        out.append("\n✅ All expected directories and files present")
+
+    sys.stdout.write('\n'.join(out) + '\n')
+    return not issues
 
 
-def check_cross_references():
+def check_cross_references(ctx):
     """Validate cross-references between YAML files and images."""
-    print("\n" + "=" * 60)
-    print("CROSS-REFERENCE VALIDATION")
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("CROSS-REFERENCE VALIDATION")
+    out.append("=" * 60)
 
     issues = []
 
-    # Load all character and location IDs
-    character_ids = set()
-    location_ids = set()
-
-    for yaml_file in Path('characters').glob('*.yaml'):
-        character_ids.add(yaml_file.stem)
-
-    for yaml_file in Path('locations').glob('*.yaml'):
-        location_ids.add(yaml_file.stem)
-
-    print("\nValidating character attempt_locations:")
-    for char_file in Path('characters').glob('*.yaml'):
-        with open(char_file, 'r') as f:
-            data = yaml.safe_load(f)
-
-        if 'attempt_locations' in data:
-            for loc in data['attempt_locations']:
-                if loc not in location_ids:
-                    issue = f"  ✗ {char_file.stem}: references non-existent location '{loc}'"
-                    print(issue)
-                    issues.append(issue)
-                else:
-                    print(f"  ✓ {char_file.stem}: attempt_location '{loc}' exists")
-
-    print("\nValidating location character references:")
-    for loc_file in Path('locations').glob('*.yaml'):
-        with open(loc_file, 'r') as f:
-            data = yaml.safe_load(f)
-
-        # Check attempts array
-        if 'attempts' in data:
-            for attempt in data['attempts']:
-                if 'character' in attempt:
-                    char_id = attempt['character']
-                    if char_id not in character_ids:
-                        issue = f"  ✗ {loc_file.stem}: references non-existent character '{char_id}'"
-                        print(issue)
-                        issues.append(issue)
-                    else:
-                        print(f"  ✓ {loc_file.stem}: character '{char_id}' exists")
-
-        # Check special character fields
-        for field in ['release_lead_character', 'climax_focus_character']:
-            if field in data:
-                char_id = data[field]
-                if char_id not in character_ids:
-                    issue = f"  ✗ {loc_file.stem}: {field} '{char_id}' does not exist"
-                    print(issue)
-                    issues.append(issue)
-                else:
-                    print(f"  ✓ {loc_file.stem}: {field} '{char_id}' exists")
+    # Gather every reference per file first, then check them against the ID sets in one shot
+    location_refs = {}
+    for char_file, data in ctx.characters:
+        if data.get('attempt_locations'):
+            location_refs[char_file.stem] = list(data['attempt_locations'])
+    # Location -> [(field, character ID)]; field is None for entries of the attempts array
+    character_refs = {}
+    for loc_file, data in ctx.locations:
+        refs = [(None, attempt['character']) for attempt in data.get('attempts') or [] if 'character' in attempt]
+        refs += [(field, data[field]) for field in ['release_lead_character', 'climax_focus_character'] if field in data]
+        if refs:
+            character_refs[loc_file.stem] = refs
+
+    missing_locations = set().union(*location_refs.values()) - ctx.location_ids
+    missing_characters = {char_id for refs in character_refs.values() for _, char_id in refs} - ctx.character_ids
+
+    out.append("\nValidating character attempt_locations:")
+    for char_id, locs in location_refs.items():
+        bad_locs = [loc for loc in locs if loc in missing_locations]
+        for loc in bad_locs:
+            issue = f"  ✗ {char_id}: references non-existent location '{loc}'"
+            out.append(issue)
+            issues.append(issue)
+        if len(locs) > len(bad_locs):
+            _report_ok(out, f"  ✓ {char_id}: {len(locs) - len(bad_locs)} attempt_location reference(s) valid")
+
+    out.append("\nValidating location character references:")
+    for loc_id, refs in character_refs.items():
+        bad_refs = [(field, char_id) for field, char_id in refs if char_id in missing_characters]
+        for field, char_id in bad_refs:
+            if field is None:
+                issue = f"  ✗ {loc_id}: references non-existent character '{char_id}'"
+            else:
+                issue = f"  ✗ {loc_id}: {field} '{char_id}' does not exist"
+            out.append(issue)
+            issues.append(issue)
+        if len(refs) > len(bad_refs):
+            _report_ok(out, f"  ✓ {loc_id}: {len(refs) - len(bad_refs)} character reference(s) valid")
 
     if issues:
-        print(f"\n❌ {len(issues)} cross-reference issue(s) found")
-        return False
+        out.append(f"\n❌ {len(issues)} cross-reference issue(s) found")
     else:
-        print("\n✅ All cross-references are valid")
-        return True
+        out.append("\n✅ All cross-references are valid")
 
+    sys.stdout.write('\n'.join(out) + '\n')
+    return not issues
 
-def check_visual_field_structure():
-    """Check that visual fields contain only plain strings, no nested elements."""
-    print("\n" + "=" * 60)
-    print("VISUAL FIELD STRUCTURE VALIDATION")
-    print("=" * 60)
 
-    issues = []
+# Required fields for characters (description is optional)
+REQUIRED_CHARACTER_FIELDS = ['name', 'age']
 
-    print("\nValidating character visual fields:")
-    for char_file in Path('characters').glob('*.yaml'):
-        with open(char_file, 'r') as f:
-            data = yaml.safe_load(f)
+# Required fields for locations (type is optional, but display_name is required)
+REQUIRED_LOCATION_FIELDS = ['display_name']
 
-        if 'visual' not in data:
-            print(f"  - {char_file.stem}: no visual field (skipped)")
-            continue
 
-        visual = data['visual']
-        if not isinstance(visual, list):
-            issue = f"  ✗ {char_file.stem}: visual field is not a list"
-            print(issue)
+def _check_fields(data, stem, required_fields, issues, out):
+    """Check that a YAML file has all required fields."""
+    # Set difference against the top-level keys; the list below only keeps the report in field order
+    missing = set(required_fields) - data.keys()
+    if missing:
+        missing_fields = [field for field in required_fields if field in missing]
+        issue = f"  ✗ {stem}: missing fields {missing_fields}"
+        out.append(issue)
+        issues.append(issue)
+    else:
+        _report_ok(out, f"  ✓ {stem}: has all required fields")
+
+
+def _check_visual(data, stem, issues, out):
+    """Check that a YAML file's visual field contains only plain strings, no nested elements."""
+    if 'visual' not in data:
+        out.append(f"  - {stem}: no visual field (skipped)")
+        return
+
+    visual = data['visual']
+    if not isinstance(visual, list):
+        issue = f"  ✗ {stem}: visual field is not a list"
+        out.append(issue)
+        issues.append(issue)
+        return
+
+    has_nested = False
+    for i, item in enumerate(visual):
+        if not isinstance(item, str):
+            issue = f"  ✗ {stem}: visual[{i}] is {type(item).__name__}, expected str"
+            out.append(issue)
             issues.append(issue)
-            continue
+            has_nested = True
 
-        has_nested = False
-        for i, item in enumerate(visual):
-            if not isinstance(item, str):
-                issue = f"  ✗ {char_file.stem}: visual[{i}] is {type(item).__name__}, expected str"
-                print(issue)
-                issues.append(issue)
-                has_nested = True
+    if not has_nested:
+        _report_ok(out, f"  ✓ {stem}: all visual items are plain strings")
 
-        if not has_nested:
-            print(f"  ✓ {char_file.stem}: all visual items are plain strings")
 
-    print("\nValidating location visual fields:")
-    for loc_file in Path('locations').glob('*.yaml'):
-        with open(loc_file, 'r') as f:
-            data = yaml.safe_load(f)
+def _check_character(data, stem, issues, out):
+    """Run all field-level checks on a character YAML."""
+    _check_fields(data, stem, REQUIRED_CHARACTER_FIELDS, issues, out)
+    _check_visual(data, stem, issues, out)
 
-        if 'visual' not in data:
-            print(f"  - {loc_file.stem}: no visual field (skipped)")
-            continue
 
-        visual = data['visual']
-        if not isinstance(visual, list):
-            issue = f"  ✗ {loc_file.stem}: visual field is not a list"
-            print(issue)
-            issues.append(issue)
-            continue
+def _check_location(data, stem, issues, out):
+    """Run all field-level checks on a location YAML."""
+    _check_fields(data, stem, REQUIRED_LOCATION_FIELDS, issues, out)
+    _check_visual(data, stem, issues, out)
 
-        has_nested = False
-        for i, item in enumerate(visual):
-            if not isinstance(item, str):
-                issue = f"  ✗ {loc_file.stem}: visual[{i}] is {type(item).__name__}, expected str"
-                print(issue)
-                issues.append(issue)
-                has_nested = True
 
-        if not has_nested:
-            print(f"  ✓ {loc_file.stem}: all visual items are plain strings")
-
-    if issues:
-        print(f"\n❌ {len(issues)} visual field structure issue(s) found")
-        return False
-    else:
-        print("\n✅ All visual fields contain plain strings only")
-        return True
-
-
-def check_yaml_structure():
-    """Check YAML structure consistency across files."""
-    print("\n" + "=" * 60)
-    print("YAML STRUCTURE CONSISTENCY")
-    print("=" * 60)
+def check_yaml_semantics(ctx):
+    """Check required fields and visual field structure in one pass over each YAML file."""
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("YAML STRUCTURE AND VISUAL FIELD VALIDATION")
+    out.append("=" * 60)
 
     issues = []
 
-    # Required fields for characters (description is optional)
-    required_character_fields = ['name', 'age']
-
-    print("\nValidating character file structure:")
-    for char_file in Path('characters').glob('*.yaml'):
-        with open(char_file, 'r') as f:
-            data = yaml.safe_load(f)
-
-        missing_fields = [field for field in required_character_fields if field not in data]
-        if missing_fields:
-            issue = f"  ✗ {char_file.stem}: missing fields {missing_fields}"
-            print(issue)
-            issues.append(issue)
-        else:
-            print(f"  ✓ {char_file.stem}: has all required fields")
-
-    # Required fields for locations (type is optional, but display_name is required)
-    required_location_fields = ['display_name']
+    out.append("\nValidating character files:")
+    for char_file, data in ctx.characters:
+        _check_character(data, char_file.stem, issues, out)
 
-    print("\nValidating location file structure:")
-    for loc_file in Path('locations').glob('*.yaml'):
-        with open(loc_file, 'r') as f:
-            data = yaml.safe_load(f)
-
-        missing_fields = [field for field in required_location_fields if field not in data]
-        if missing_fields:
-            issue = f"  ✗ {loc_file.stem}: missing fields {missing_fields}"
-            print(issue)
-            issues.append(issue)
-        else:
-            print(f"  ✓ {loc_file.stem}: has all required fields")
+    out.append("\nValidating location files:")
+    for loc_file, data in ctx.locations:
+        _check_location(data, loc_file.stem, issues, out)
 
     if issues:
-        print(f"\n❌ {len(issues)} structure issue(s) found")
-        return False
+        out.append(f"\n❌ {len(issues)} structure issue(s) found")
     else:
-        print("\n✅ All YAML files have consistent structure")
-        return True
+        out.append("\n✅ All YAML files have required fields and plain-string visual fields")
+
+    sys.stdout.write('\n'.join(out) + '\n')
+    return not issues
 
 
-def check_naming_conventions():
+def check_naming_conventions(ctx):
     """Validate file naming conventions."""
-    print("\n" + "=" * 60)
-    print("NAMING CONVENTION VALIDATION")
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("NAMING CONVENTION VALIDATION")
+    out.append("=" * 60)
 
     issues = []
 
     # Check YAML file naming (should be lowercase with underscores)
-    yaml_pattern = re.compile(r'^[a-z][a-z0-9_]*\.yaml$')
-
-    print("\nValidating YAML file names:")
-    for yaml_file in list(Path('characters').glob('*.yaml')) + list(Path('locations').glob('*.yaml')):
-        if not yaml_pattern.match(yaml_file.name):
-            issue = f"  ✗ {yaml_file}: does not match naming pattern (lowercase, underscores only)"
-            print(issue)
-            issues.append(issue)
-        else:
-            print(f"  ✓ {yaml_file.name}")
-
-    # Check image file naming (should be id-XX.jpg, where id can contain hyphens for multi-word names)
-    image_pattern = re.compile(r'^[a-z][a-z0-9_-]*-\d{2}\.jpg$')
-
-    print("\nValidating image file names:")
-    if Path('ref/characters').exists():
-        for img_file in Path('ref/characters').glob('*.jpg'):
-            if not image_pattern.match(img_file.name):
-                issue = f"  ✗ ref/characters/{img_file.name}: does not match pattern (id-XX.jpg)"
-                print(issue)
+    out.append("\nValidating YAML file names:")
+    for yaml_dir in ['characters', 'locations']:
+        for yaml_name in _list_files(yaml_dir, '.yaml'):
+            if not YAML_NAME_PATTERN.fullmatch(yaml_name):
+                issue = f"  ✗ {yaml_dir}/{yaml_name}: does not match naming pattern (lowercase, underscores only)"
+                out.append(issue)
                 issues.append(issue)
             else:
-                print(f"  ✓ ref/characters/{img_file.name}")
+                _report_ok(out, f"  ✓ {yaml_name}")
 
-    if Path('ref/locations').exists():
-        for img_file in Path('ref/locations').glob('*.jpg'):
-            if not image_pattern.match(img_file.name):
-                issue = f"  ✗ ref/locations/{img_file.name}: does not match pattern (id-XX.jpg)"
-                print(issue)
-                issues.append(issue)
+    # Check image file naming (should be id-XX.jpg, where id can contain hyphens for multi-word names)
+    out.append("\nValidating image file names:")
+    for ref_dir in [REF_CHARACTERS_DIR, REF_LOCATIONS_DIR]:
+        if ref_dir in ctx.dirs_present:
+            for img_name in _list_jpg(ref_dir):
+                if not IMAGE_NAME_PATTERN.fullmatch(img_name):
+                    issue = f"  ✗ {ref_dir}/{img_name}: does not match pattern (id-XX.jpg)"
+                    out.append(issue)
+                    issues.append(issue)
+                else:
+                    _report_ok(out, f"  ✓ {ref_dir}/{img_name}")
+
+    # Check ID consistency between YAML and images, using the image index shared
+    # with check_reference_images (misnamed images don't count as a match)
+    out.append("\nValidating ID consistency between YAML files and images:")
+    for yaml_dir, ref_dir in [('characters', REF_CHARACTERS_DIR), ('locations', REF_LOCATIONS_DIR)]:
+        img_counts, _ = _image_index(ref_dir)
+        for yaml_id in _list_yaml(yaml_dir):
+            if yaml_id in img_counts:
+                _report_ok(out, f"  ✓ {yaml_id}: YAML and image ID match")
             else:
-                print(f"  ✓ ref/locations/{img_file.name}")
-
-    # Check ID consistency between YAML and images
-    print("\nValidating ID consistency between YAML files and images:")
-
-    # Characters
-    for char_file in Path('characters').glob('*.yaml'):
-        char_id = char_file.stem
-        has_image = False
-        if Path('ref/characters').exists():
-            for img in Path('ref/characters').glob('*.jpg'):
-                img_id = img.stem.rsplit('-', 1)[0].replace('-', '_')
-                if img_id == char_id:
-                    has_image = True
-                    break
-
-        if has_image:
-            print(f"  ✓ {char_id}: YAML and image ID match")
-        else:
-            issue = f"  ✗ {char_id}: YAML exists but no matching image ID found"
-            print(issue)
-            issues.append(issue)
-
-    # Locations
-    for loc_file in Path('locations').glob('*.yaml'):
-        loc_id = loc_file.stem
-        has_image = False
-        if Path('ref/locations').exists():
-            for img in Path('ref/locations').glob('*.jpg'):
-                img_id = img.stem.rsplit('-', 1)[0]
-                if img_id == loc_id:
-                    has_image = True
-                    break
-
-        if has_image:
-            print(f"  ✓ {loc_id}: YAML and image ID match")
-        else:
-            issue = f"  ✗ {loc_id}: YAML exists but no matching image ID found"
-            print(issue)
-            issues.append(issue)
+                issue = f"  ✗ {yaml_id}: YAML exists but no matching image ID found"
+                out.append(issue)
+                issues.append(issue)
 
     if issues:
-        print(f"\n❌ {len(issues)} naming convention issue(s) found")
-        return False
+        out.append(f"\n❌ {len(issues)} naming convention issue(s) found")
     else:
-        print("\n✅ All files follow naming conventions")
-        return True
+        out.append("\n✅ All files follow naming conventions")
+
+    sys.stdout.write('\n'.join(out) + '\n')
+    return not issues
 
 
 def main():
     """Run all consistency checks."""
+    global QUIET
+
+    parser = argparse.ArgumentParser(description="Check for inconsistencies in the Katha Base project.")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Only report problems and summaries")
+    args = parser.parse_args()
+    QUIET = args.quiet
+
     print("KATHA BASE - INCONSISTENCY CHECKER")
     print()
 
     all_passed = True
 
+    # Scan directories and parse every YAML file once; all checks share the result
+    ctx = build_context()
+
     # Run YAML validation
-    if not validate_yaml_files():
+    if not validate_yaml_files(ctx):
         all_passed = False
 
     # Check image naming conventions
-    if not check_image_naming():
+    if not check_image_naming(ctx):
         all_passed = False
 
     # Run file inventory check
-    if not check_file_inventory():
+    if not check_file_inventory(ctx):
         all_passed = False
 
     # Run cross-reference validation
-    if not check_cross_references():
-        all_passed = False
-
-    # Run YAML structure consistency check
-    if not check_yaml_structure():
+    if not check_cross_references(ctx):
         all_passed = False
 
-    # Run visual field structure check
-    if not check_visual_field_structure():
+    # Run YAML structure and visual field checks
+    if not check_yaml_semantics(ctx):
         all_passed = False
 
     # Run naming convention validation
-    if not check_naming_conventions():
+    if not check_naming_conventions(ctx):
         all_passed = False
 
     # Run reference image check
-    if not check_reference_images():
+    if not check_reference_images(ctx):
         all_passed = False
 
     # Final summary
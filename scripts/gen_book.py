@@ -15,6 +15,7 @@ Options:
     --message MESSAGE - Commit message for a new version (required if prompts changed)
     --seed N          - Seed for reproducible generation (included in prompt hash)
     --workers N       - Number of concurrent image generation tasks (default: 10)
+                        (alias: --jobs/-j)
 
 Example:
     uv run scripts/gen_book.py cullan
@@ -37,19 +38,36 @@ The --seed parameter is included in the prompt hash, so different seeds
 produce different cached images.
 """
 
+import io
+import glob
+import hashlib
+import os
 import sys
+import pickle
+import threading
 import re
 import asyncio
 import argparse
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
 
 # Add parent directory to path so we can import from scripts package
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from PIL import Image
+from reportlab import rl_config
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas as pdf_canvas
 from scripts import gen_image
 from scripts import versioning
 
+# Embed JPEG page data as raw binary rather than ASCII85 text (~25% smaller PDFs)
+rl_config.useA85 = 0
+
 __all__ = ['generate_book']
 
 STORY_DIR = Path('out/story')
@@ -60,34 +78,90 @@ CHILDREN = ['arthur', 'cullan', 'emer', 'hansel', 'henry', 'james']
 # Default concurrent image generation tasks
 DEFAULT_WORKERS = 10
 
+# Character and style IDs: lowercase with underscores
+ID_PATTERN = re.compile(r'^[a-z_]+$')
+
+# Concurrent prompt TXT writes
+PROMPT_WRITE_WORKERS = 16
+
+# PDF page resolution (pixels per inch) and JPEG quality of embedded pages
+PDF_RESOLUTION = 100.0
+PDF_JPEG_QUALITY = 85
+
+# Parsed page YAML, pickled and keyed by (mtime_ns, size) of the source file
+PAGE_CACHE_DIR = Path('.cache/pages')
+
+# Framed PDF pages (JPEG), keyed by the source image and the framing fingerprint
+FRAMED_CACHE_DIR = Path('.cache/framed')
+
+# Built prompts from previous runs; bump the schema when PagePrompt changes
+PROMPT_CACHE_PATH = Path('.cache/prompts.pkl')
+PROMPT_CACHE_SCHEMA = 1
+
+# Everything build_prompt reads besides the page file itself
+PROMPT_DEPENDENCY_DIRS = [
+    Path('story'),
+    Path('characters'),
+    Path('locations'),
+    Path('ref/styles'),
+    Path('ref/characters'),
+    Path('ref/locations'),
+    Path('ref/objects'),
+]
+
+
+@dataclass(frozen=True, slots=True)
+class PagePrompt:
+    """The built prompt for one page, in page order within a book."""
+    page_stem: str
+    prompt: str
+    ref_images: list[str]
+    ref_labels: list[str]
+    prompt_hash: str
+
+
+def _list_page_names() -> list[str]:
+    """Get the sorted names of all page files (p*.yaml) in the story directory."""
+    try:
+        with os.scandir(STORY_DIR) as entries:
+            names = [e.name for e in entries if e.name.startswith('p') and e.name.endswith('.yaml')]
+    except FileNotFoundError:
+        return []
+    names.sort()
+    return names
+
+
+def _page_characters_part(page_stem: str) -> str:
+    """Return the characters part of a page stem, or '' if it is not a page stem.
+
+    Page stems follow the pattern p{number}-{char1}-{char2}-{...},
+    e.g. "p09-arthur-cullan" -> "arthur-cullan".
+    """
+    number, _, chars_part = page_stem.partition('-')
+    if number[:1] == 'p' and number[1:].isdigit():
+        return chars_part
+    return ''
+
 
 def _get_pages_for_character(character_id: str) -> list[Path]:
     """Find all page files that feature the given character.
 
     Page filenames follow the pattern: p{number}-{char1}-{char2}-{...}.yaml
     """
-    if not STORY_DIR.exists():
-        return []
-
     pages = []
-    for page_file in sorted(STORY_DIR.glob('p*.yaml')):
+    for name in _list_page_names():
         # Extract character list from filename (everything after p##-)
-        stem = page_file.stem  # e.g., "p09-arthur-cullan"
-        match = re.match(r'p\d+-(.+)$', stem)
-        if match:
-            chars_part = match.group(1)  # e.g., "arthur-cullan"
-            characters = chars_part.split('-')
-            if character_id in characters:
-                pages.append(page_file)
+        stem = name.removesuffix('.yaml')  # e.g., "p09-arthur-cullan"
+        chars_part = _page_characters_part(stem)  # e.g., "arthur-cullan"
+        if chars_part and f'-{character_id}-' in f'-{chars_part}-':
+            pages.append(STORY_DIR / name)
 
     return pages
 
 
 def _get_all_pages() -> list[Path]:
     """Get all page files in the story directory."""
-    if not STORY_DIR.exists():
-        return []
-    return sorted(STORY_DIR.glob('p*.yaml'))
+    return [STORY_DIR / name for name in _list_page_names()]
 
 
 def _get_characters_from_stem(page_stem: str) -> list[str]:
@@ -99,46 +173,136 @@ def _get_characters_from_stem(page_stem: str) -> list[str]:
     Returns:
         List of character IDs, e.g., ["arthur", "cullan"]
     """
-    match = re.match(r'p\d+-(.+)$', page_stem)
-    if match:
-        return match.group(1).split('-')
+    chars_part = _page_characters_part(page_stem)
+    if chars_part:
+        return chars_part.split('-')
     return []
 
 
-def _build_all_prompts(page_files: list[Path], style_id: str, seed: int | None = None) -> dict[str, tuple[str, list[str], list[str], str]]:
+def _cached_load(page_file: Path) -> dict:
+    """Load a page YAML, reusing the pickled parse if the file is unchanged."""
+    st = page_file.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cache_path = PAGE_CACHE_DIR / f'{page_file.stem}.pkl'
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+
+    data = gen_image._load_yaml_file(page_file)
+    PAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix('.pkl.tmp')
+    with open(tmp_path, 'wb') as f:
+        pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return data
+
+
+def _build_one(page_file: Path, style_id: str, seed: int | None = None) -> PagePrompt:
+    """Load one page YAML and build its prompt and hash (process pool worker)."""
+    page_data = _cached_load(page_file)
+    prompt, ref_images, ref_labels = gen_image.build_prompt(page_data, style_id)
+    prompt_hash = versioning.compute_prompt_hash(prompt, seed, ref_images)
+    return PagePrompt(page_file.stem, prompt, ref_images, ref_labels, prompt_hash)
+
+
+def _prompt_dependencies() -> tuple:
+    """Fingerprint the files a prompt depends on, other than its page YAML.
+
+    Covers the style/template/character/location YAML, the reference image
+    listings, gen_image.py (which builds the prompt) and versioning.py (which
+    hashes it), as (path, mtime_ns, size) triples.
+    """
+    entries = []
+    for directory in PROMPT_DEPENDENCY_DIRS:
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_file():
+                        st = entry.stat()
+                        entries.append((entry.path, st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            continue
+    for module_file in (gen_image.__file__, versioning.__file__):
+        st = os.stat(module_file)
+        entries.append((module_file, st.st_mtime_ns, st.st_size))
+    return tuple(sorted(entries))
+
+
+def _load_prompt_cache(dependencies: tuple) -> dict:
+    """Load cached prompts, or an empty dict if the cache is missing or stale."""
+    try:
+        with open(PROMPT_CACHE_PATH, 'rb') as f:
+            cache = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return {}
+    if cache.get('schema') != PROMPT_CACHE_SCHEMA or cache.get('dependencies') != dependencies:
+        return {}
+    return cache['entries']
+
+
+def _save_prompt_cache(dependencies: tuple, entries: dict) -> None:
+    """Atomically write the prompt cache."""
+    PROMPT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = PROMPT_CACHE_PATH.with_suffix('.pkl.tmp')
+    with open(tmp_path, 'wb') as f:
+        cache = {'schema': PROMPT_CACHE_SCHEMA, 'dependencies': dependencies, 'entries': entries}
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, PROMPT_CACHE_PATH)
+
+
+def _build_all_prompts(page_files: list[Path], style_id: str, seed: int | None = None) -> list[PagePrompt]:
     """Build prompts for all pages upfront.
 
+    Prompts are reused from the previous run for pages whose YAML (mtime and
+    size) and dependencies are unchanged. The rest are parsed and hashed across
+    a process pool. Results keep page order.
+
     Args:
         page_files: List of page YAML file paths to process
         style_id: The style identifier (e.g., 'genealogy_witch')
         seed: Optional seed for reproducible generation
 
     Returns:
-        dict mapping page_stem to tuple of (prompt, ref_images, ref_labels, prompt_hash)
+        list of PagePrompt, one per page file, in the same order
     """
-    import yaml
+    if not page_files:
+        return []
 
-    prompts = {}
+    dependencies = _prompt_dependencies()
+    cache = _load_prompt_cache(dependencies)
+
+    keys = []
     for page_file in page_files:
-        with open(page_file) as f:
-            page_data = yaml.safe_load(f)
-        prompt, ref_images, ref_labels = gen_image.build_prompt(page_data, style_id)
-        prompt_hash = versioning.compute_prompt_hash(prompt, seed, ref_images)
-        prompts[page_file.stem] = (prompt, ref_images, ref_labels, prompt_hash)
+        st = page_file.stat()
+        keys.append((str(page_file), st.st_mtime_ns, st.st_size, style_id, seed))
+    missing = [page_file for page_file, key in zip(page_files, keys) if key not in cache]
+
+    if missing:
+        build = partial(_build_one, style_id=style_id, seed=seed)
+        with ProcessPoolExecutor(max_workers=min(len(missing), os.cpu_count() or 1)) as executor:
+            built = dict(zip(missing, executor.map(build, missing)))
+        for page_file, key in zip(page_files, keys):
+            if page_file in built:
+                cache[key] = built[page_file]
+        _save_prompt_cache(dependencies, cache)
 
-    return prompts
+    return [cache[key] for key in keys]
 
 
-def _get_hashes_from_prompts(prompts: dict[str, tuple]) -> dict[str, str]:
-    """Extract just the hashes from a prompts dict.
+def _get_hashes_from_prompts(prompts: list[PagePrompt]) -> dict[str, str]:
+    """Extract just the hashes from a prompts list.
 
     Args:
-        prompts: dict from _build_all_prompts()
+        prompts: list from _build_all_prompts()
 
     Returns:
         dict mapping page_stem to prompt_hash
     """
-    return {page_stem: data[3] for page_stem, data in prompts.items()}
+    return {page.page_stem: page.prompt_hash for page in prompts}
 
 
 def _check_version_needed(current_hashes: dict[str, str], style_id: str, message: str | None) -> int:
@@ -180,20 +344,22 @@ def _check_version_needed(current_hashes: dict[str, str], style_id: str, message
             sys.exit(1)
         return versioning.create_new_version(message, style_id)
 
-    # Compare current hashes against stored hashes
+    # Compare current hashes against stored hashes: (stem, hash) pairs not in the manifest
     stored_hashes = {k: v.get('prompt_hash') for k, v in manifest.get('images', {}).items()}
-
-    # Check if any page's prompt has changed or is missing from manifest
-    prompts_changed = False
-    for page_stem, current_hash in current_hashes.items():
-        stored_hash = stored_hashes.get(page_stem)
-        if stored_hash is None:
-            # Page not in manifest - this is a new page or manifest was incomplete
-            prompts_changed = True
-            print(f"New page (not in manifest): {page_stem} [{current_hash}]")
-        elif stored_hash != current_hash:
-            prompts_changed = True
-            print(f"Prompt changed for {page_stem}: {stored_hash} -> {current_hash}")
+    changed = current_hashes.items() - stored_hashes.items()
+    prompts_changed = bool(changed)
+
+    # Report new or changed pages in page order
+    if changed:
+        for page_stem, current_hash in current_hashes.items():
+            if (page_stem, current_hash) not in changed:
+                continue
+            stored_hash = stored_hashes.get(page_stem)
+            if stored_hash is None:
+                # Page not in manifest - this is a new page or manifest was incomplete
+                print(f"New page (not in manifest): {page_stem} [{current_hash}]")
+            else:
+                print(f"Prompt changed for {page_stem}: {stored_hash} -> {current_hash}")
 
     if prompts_changed:
         if not message:
@@ -208,102 +374,220 @@ def _check_version_needed(current_hashes: dict[str, str], style_id: str, message
     return latest_version
 
 
-def _create_pdf_from_images(image_paths: list[Path], output_path: Path):
+@lru_cache(maxsize=None)
+def _framing_fingerprint() -> tuple:
+    """Fingerprint everything that shapes a framed page besides the source image.
+
+    Covers the print dimensions, the JPEG quality and gen_image.py itself
+    (which holds frame_image_for_pdf), the latter as (path, mtime_ns, size).
+    """
+    st = os.stat(gen_image.__file__)
+    return (
+        gen_image.CONTENT_WIDTH, gen_image.CONTENT_HEIGHT,
+        gen_image.FULL_WIDTH, gen_image.FULL_HEIGHT,
+        gen_image.BLEED, gen_image.CENTER_GUTTER,
+        PDF_JPEG_QUALITY,
+        (gen_image.__file__, st.st_mtime_ns, st.st_size),
+    )
+
+
+def _frame_for_pdf(img_path: Path) -> tuple[int, int, bytes]:
+    """Frame one raw image for the PDF and encode it as an RGB JPEG.
+
+    The encoded page is cached in FRAMED_CACHE_DIR under a name hashed from the
+    source image's (mtime_ns, size) and the framing fingerprint, so a hit means
+    neither the image nor the framing code and constants have changed. Writing
+    a new entry removes the stale ones for the same image.
+
+    Returns:
+        tuple of (width, height, jpeg_bytes)
+    """
+    img_path = Path(img_path)
+    st = img_path.stat()
+    key = repr((_framing_fingerprint(), st.st_mtime_ns, st.st_size))
+    digest = hashlib.sha256(key.encode(), usedforsecurity=False).hexdigest()[:12]
+    cache_path = FRAMED_CACHE_DIR / f'{img_path.stem}-{digest}.jpg'
+    try:
+        jpeg_bytes = cache_path.read_bytes()
+    except FileNotFoundError:
+        pass
+    else:
+        with Image.open(io.BytesIO(jpeg_bytes)) as cached:
+            width, height = cached.size
+        return width, height, jpeg_bytes
+
+    framed = gen_image.frame_image_for_pdf(img_path)
+    if framed.mode != 'RGB':
+        framed = framed.convert('RGB')
+    buffer = io.BytesIO()
+    framed.save(buffer, 'JPEG', quality=PDF_JPEG_QUALITY, optimize=True)
+    width, height = framed.size
+    framed.close()
+    jpeg_bytes = buffer.getvalue()
+
+    FRAMED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f'{cache_path.name}.{threading.get_ident()}.tmp')
+    tmp_path.write_bytes(jpeg_bytes)
+    os.replace(tmp_path, cache_path)
+
+    # Drop entries for this image left by older images or framing fingerprints
+    stale = re.compile(re.escape(img_path.stem) + r'-[0-9a-f]{12}\.jpg')
+    for old_path in FRAMED_CACHE_DIR.glob(f'{glob.escape(img_path.stem)}-*.jpg'):
+        if old_path != cache_path and stale.fullmatch(old_path.name):
+            old_path.unlink(missing_ok=True)
+    return width, height, jpeg_bytes
+
+
+def _iter_framed(image_paths: list[Path], workers: int, framed: dict | None = None):
+    """Yield framed pages in order, framing at most `workers` pages ahead.
+
+    Pages already present in `framed` (image path -> future from
+    _frame_for_pdf) are taken from there instead of being framed again.
+    """
+    framed = framed or {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        def submit(img_path):
+            if img_path in framed:
+                return framed[img_path]
+            return executor.submit(_frame_for_pdf, img_path)
+
+        paths = iter(image_paths)
+        pending = deque(submit(p) for p in islice(paths, workers))
+        while pending:
+            page = pending.popleft().result()
+            for img_path in islice(paths, 1):
+                pending.append(submit(img_path))
+            yield page
+
+
+def _create_pdf_from_images(image_paths: list[Path], output_path: Path, framed: dict | None = None):
     """Create a PDF from raw images, framing them in-memory.
 
+    Pages are framed a few at a time and written as they arrive, so only the
+    encoded JPEGs (not every full-size framed bitmap) are held until the save.
+
     Args:
         image_paths: Paths to raw (unframed) images
         output_path: Where to save the PDF
+        framed: Optional dict mapping image path to a future of already-framed pages
     """
     if not image_paths:
         return
 
-    # Frame each image in-memory and collect
-    framed_images = []
-    for img_path in image_paths:
-        framed = gen_image.frame_image_for_pdf(img_path)
-        if framed.mode != 'RGB':
-            framed = framed.convert('RGB')
-        framed_images.append(framed)
-
-    # Save as PDF
-    framed_images[0].save(
-        output_path,
-        save_all=True,
-        append_images=framed_images[1:] if len(framed_images) > 1 else [],
-        resolution=100.0
-    )
+    # Frame on a thread pool (Pillow releases the GIL while resizing), keeping page order
+    workers = min(len(image_paths), os.cpu_count() or 1)
+    pdf = pdf_canvas.Canvas(str(output_path))
+    for width, height, jpeg_bytes in _iter_framed(image_paths, workers, framed):
+        page_size = (width * 72 / PDF_RESOLUTION, height * 72 / PDF_RESOLUTION)
+        pdf.setPageSize(page_size)
+        pdf.drawImage(ImageReader(io.BytesIO(jpeg_bytes)), 0, 0, *page_size)
+        pdf.showPage()
+    pdf.save()
 
 
-def _save_prompts(prompts: dict[str, tuple[str, list[str], list[str], str]]) -> None:
+def _save_prompts(prompts: list[PagePrompt]) -> None:
     """Save prompt text files to out/images/ (if they don't exist).
 
     Args:
-        prompts: dict from _build_all_prompts()
+        prompts: list from _build_all_prompts()
     """
-    versioning.IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    images_dir = versioning.IMAGES_DIR
+    images_dir.mkdir(parents=True, exist_ok=True)
 
-    for page_stem, (prompt, _, _, prompt_hash) in prompts.items():
-        prompt_path = versioning.get_prompt_path(page_stem, prompt_hash)
-        if not prompt_path.exists():
-            prompt_path.write_text(prompt)
-            print(f"Saved prompt: {prompt_path}")
+    # One directory scan instead of an exists() call per prompt
+    with os.scandir(images_dir) as entries:
+        existing = {entry.name for entry in entries}
 
+    to_write = {}
+    for page in prompts:
+        prompt_path = versioning.get_prompt_path(page.page_stem, page.prompt_hash)
+        if prompt_path.name not in existing:
+            existing.add(prompt_path.name)
+            to_write[prompt_path] = page.prompt
 
-async def _generate_images_parallel(prompts: dict[str, tuple], version: int, seed: int | None = None, workers: int = DEFAULT_WORKERS) -> dict[str, Path]:
+    # Small independent writes: issue them concurrently, report in page order
+    with ThreadPoolExecutor(max_workers=PROMPT_WRITE_WORKERS) as executor:
+        list(executor.map(Path.write_text, to_write, to_write.values()))
+    for prompt_path in to_write:
+        print(f"Saved prompt: {prompt_path}")
+
+
+async def _generate_images_parallel(prompts: list[PagePrompt], version: int, seed: int | None = None, workers: int = DEFAULT_WORKERS, on_page_done=None) -> dict[str, Path]:
     """Generate images for all pages in parallel.
 
-    Uses asyncio.Semaphore to limit concurrent API calls.
-    Updates the manifest immediately after each image completes (thread-safe).
-    Individual failures are logged but don't stop other workers.
+    A fixed pool of `workers` consumer tasks pulls pages from a queue, so the
+    worker count is the concurrency cap and progress is reported as each page
+    finishes. Updates the manifest immediately after each image completes
+    (thread-safe). Individual failures are logged but don't stop other workers.
 
     Args:
         prompts: Pre-built prompts from _build_all_prompts()
         version: The version number to update manifest for
         seed: Optional seed for reproducible generation
         workers: Number of concurrent workers
+        on_page_done: Optional callback invoked as on_page_done(page_stem, image_path)
+                      as soon as each page settles; image_path is None if it failed
 
     Returns:
         dict mapping page_stem to generated image path (only successful generations)
     """
-    semaphore = asyncio.Semaphore(workers)
     total = len(prompts)
     failed_pages = []
+    results = {}
 
-    async def generate_one(page_stem: str, data: tuple) -> tuple[str, Path | None]:
-        prompt, ref_images, ref_labels, prompt_hash = data
-        async with semaphore:
+    # Pages whose image already exists need no API call or worker slot
+    versioning.IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    with os.scandir(versioning.IMAGES_DIR) as entries:
+        existing = {entry.name for entry in entries}
+
+    queue = asyncio.Queue()
+    reused = []
+    for page in prompts:
+        image_path = versioning.get_image_path(page.page_stem, page.prompt_hash)
+        if image_path.name not in existing:
+            queue.put_nowait(page)
+            continue
+        results[page.page_stem] = image_path
+        if on_page_done is not None:
+            on_page_done(page.page_stem, image_path)
+        reused.append((page.page_stem, image_path.name, page.prompt_hash))
+    if reused:
+        # One manifest write for all reused images; new ones are still recorded as each lands
+        versioning.update_manifest_images(version, reused)
+        print(f"Reusing {len(reused)} existing image(s) with matching prompt hashes")
+
+    async def worker() -> None:
+        while not queue.empty():
+            page = queue.get_nowait()
+            page_stem, prompt_hash = page.page_stem, page.prompt_hash
             try:
                 image_path = await gen_image.generate_image_from_prompt_async(
-                    prompt=prompt,
-                    ref_images=ref_images,
-                    ref_labels=ref_labels,
+                    prompt=page.prompt,
+                    ref_images=page.ref_images,
+                    ref_labels=page.ref_labels,
                     page_stem=page_stem,
                     prompt_hash=prompt_hash,
                     seed=seed
                 )
                 # Update manifest immediately (thread-safe)
                 versioning.update_manifest_image(version, page_stem, image_path.name, prompt_hash)
-                return page_stem, image_path
+                results[page_stem] = image_path
             except Exception as e:
-                # Log the error but don't crash - return None to indicate failure
+                # Log the error but don't crash - the page is simply left out of the results
                 print(f"[{page_stem}] FAILED: {e}")
                 failed_pages.append((page_stem, str(e)))
-                return page_stem, None
-
-    # Create tasks for all pages
-    tasks = [generate_one(stem, data) for stem, data in prompts.items()]
+                image_path = None
+            if on_page_done is not None:
+                on_page_done(page_stem, image_path)
+            print(f"Progress: {len(results) + len(failed_pages)}/{total} page(s) done")
 
-    print(f"Starting parallel generation with {workers} workers for {total} pages...")
+    print(f"Starting parallel generation with {workers} workers for {queue.qsize()} pages...")
 
-    # Run all tasks concurrently - no exceptions will propagate since we catch them in generate_one
-    results = await asyncio.gather(*tasks)
+    # No exceptions propagate from the workers since each page's errors are caught above
+    await asyncio.gather(*(worker() for _ in range(min(workers, queue.qsize()))))
 
-    # Process results - filter out failed generations (None values)
-    generated_images = {}
-    for page_stem, image_path in results:
-        if image_path is not None:
-            generated_images[page_stem] = image_path
+    # Keep page order for successful generations
+    generated_images = {page.page_stem: results[page.page_stem] for page in prompts if page.page_stem in results}
 
     # Summary of failures
     if failed_pages:
@@ -316,10 +600,89 @@ async def _generate_images_parallel(prompts: dict[str, tuple], version: int, see
     return generated_images
 
 
+def _stems_by_character(page_stems) -> dict[str, list[str]]:
+    """Index page stems by the characters they feature, each list in page order."""
+    stems_by_character = defaultdict(list)
+    for page_stem in sorted(page_stems):
+        for page_character in _get_characters_from_stem(page_stem):
+            stems_by_character[page_character].append(page_stem)
+    return stems_by_character
+
+
+async def _run_pipeline(
+    prompts: list[PagePrompt],
+    version: int,
+    seed: int | None,
+    workers: int,
+    books: list[tuple[list[str], Path]],
+    framed: dict | None = None,
+    on_image=None
+) -> tuple[dict[str, Path], list[Path]]:
+    """Save prompt files, generate images and write books in a single event loop.
+
+    Prompt TXT writes run on a worker thread while the first API calls are in
+    flight, on_image lets the caller start framing each image as soon as it
+    lands, and each book is written on a worker thread as soon as every one of
+    its pages has been generated (or has failed), while later pages are still
+    in flight.
+
+    Args:
+        prompts: Pre-built prompts from _build_all_prompts()
+        version: The version number to update manifest for
+        seed: Optional seed for reproducible generation
+        workers: Number of concurrent workers
+        books: (page stems in page order, PDF path) for each book to write
+        framed: Optional dict mapping image path to a future of already-framed pages
+        on_image: Optional callback invoked with each image path as soon as it is ready
+
+    Returns:
+        tuple of (dict mapping page_stem to generated image path, list of written PDF paths)
+    """
+    print("Saving prompt files...")
+    save_task = asyncio.create_task(asyncio.to_thread(_save_prompts, prompts))
+
+    images = {}
+    unsettled = [set(stems) for stems, _ in books]
+    book_tasks = {}
+
+    async def write_book(image_paths: list[Path], pdf_path: Path) -> Path:
+        print(f"Creating {pdf_path.name} with {len(image_paths)} page(s)...")
+        await asyncio.to_thread(_create_pdf_from_images, image_paths, pdf_path, framed)
+        print(f"Saved: {pdf_path}")
+        return pdf_path
+
+    def on_page_done(page_stem: str, image_path: Path | None) -> None:
+        if image_path is not None:
+            images[page_stem] = image_path
+            if on_image is not None:
+                on_image(image_path)
+        for index, (stems, pdf_path) in enumerate(books):
+            if page_stem not in unsettled[index]:
+                continue
+            unsettled[index].discard(page_stem)
+            if not unsettled[index]:
+                image_paths = [images[stem] for stem in stems if stem in images]
+                if image_paths:
+                    book_tasks[index] = asyncio.create_task(write_book(image_paths, pdf_path))
+
+    try:
+        generated_images = await _generate_images_parallel(prompts, version, seed, workers, on_page_done)
+    finally:
+        # Let prompt writes finish and surface their errors even if generation fails
+        await save_task
+    pdf_paths = [await book_tasks[index] for index in sorted(book_tasks)]
+
+    # Update manifest once for all books
+    versioning.update_manifest_books(version, [pdf_path.name for pdf_path in pdf_paths])
+
+    return generated_images, pdf_paths
+
+
 def _create_character_pdfs(
     generated_images: dict[str, Path],
     version: int,
-    characters: list[str] | None = None
+    characters: list[str] | None = None,
+    framed: dict | None = None
 ) -> list[Path]:
     """Create per-character PDFs from generated images.
 
@@ -328,6 +691,7 @@ def _create_character_pdfs(
         version: The version number
         characters: List of character IDs to create PDFs for.
                    If None, uses CHILDREN constant.
+        framed: Optional dict mapping image path to a future of already-framed pages
 
     Returns:
         List of paths to created PDF files
@@ -338,36 +702,48 @@ def _create_character_pdfs(
     version_path = versioning.get_version_path(version)
     version_path.mkdir(parents=True, exist_ok=True)
 
-    pdf_paths = []
+    # Index pages by character in one pass over the page stems
+    stems_by_character = _stems_by_character(generated_images)
+
+    books = []
     for character_id in characters:
-        # Filter images to pages containing this character
-        char_images = []
-        for page_stem, image_path in generated_images.items():
-            page_characters = _get_characters_from_stem(page_stem)
-            if character_id in page_characters:
-                char_images.append((page_stem, image_path))
-
-        if not char_images:
+        image_paths = [generated_images[stem] for stem in stems_by_character.get(character_id, [])]
+        if not image_paths:
             continue
 
-        # Sort by page stem to maintain order
-        char_images.sort(key=lambda x: x[0])
-        image_paths = [img for _, img in char_images]
-
-        # Create PDF
         pdf_path = version_path / f'{character_id}-book.pdf'
         print(f"Creating {character_id}-book.pdf with {len(image_paths)} page(s)...")
-        _create_pdf_from_images(image_paths, pdf_path)
+        books.append((image_paths, pdf_path))
+
+    if not books:
+        return []
+
+    # Frame each unique page once (pages are shared between books), then
+    # write the books concurrently from the encoded pages
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as frame_pool, \
+            ThreadPoolExecutor(max_workers=len(books)) as executor:
+        if framed is None:
+            framed = {}
+            for image_paths, _ in books:
+                for img_path in image_paths:
+                    if img_path not in framed:
+                        framed[img_path] = frame_pool.submit(_frame_for_pdf, img_path)
+        futures = [executor.submit(_create_pdf_from_images, image_paths, pdf_path, framed)
+                   for image_paths, pdf_path in books]
+        for future in futures:
+            future.result()
+
+    pdf_paths = [pdf_path for _, pdf_path in books]
+    for pdf_path in pdf_paths:
         print(f"Saved: {pdf_path}")
 
-        # Update manifest
-        versioning.update_manifest_book(version, pdf_path.name)
-        pdf_paths.append(pdf_path)
+    # Update manifest once for all books
+    versioning.update_manifest_books(version, [pdf_path.name for pdf_path in pdf_paths])
 
     return pdf_paths
 
 
-def generate_book(character_id: str, style_id: str, prompts: dict[str, tuple], version: int, seed: int | None = None, workers: int = DEFAULT_WORKERS) -> Path | list[Path]:
+def generate_book(character_id: str, style_id: str, prompts: list[PagePrompt], version: int, seed: int | None = None, workers: int = DEFAULT_WORKERS) -> Path | list[Path]:
     """Generate a picture book for a specific character in a specific style.
 
     Args:
@@ -392,55 +768,42 @@ def generate_book(character_id: str, style_id: str, prompts: dict[str, tuple], v
     print(f"Pages: {len(prompts)}")
     print()
 
-    # Save prompt TXT files (if not already saved)
-    print("Saving prompt files...")
-    _save_prompts(prompts)
-    print()
+    # Plan the books up front so each can be written as soon as its pages are done
+    version_path = versioning.get_version_path(version)
+    version_path.mkdir(parents=True, exist_ok=True)
+    if character_id == 'all':
+        stems_by_character = _stems_by_character(page.page_stem for page in prompts)
+        books = [(stems_by_character[child], version_path / f'{child}-book.pdf')
+                 for child in CHILDREN if child in stems_by_character]
+    else:
+        books = [(sorted(page.page_stem for page in prompts), version_path / f'{character_id}-book.pdf')]
 
-    # Generate images in parallel (manifest updated as each completes)
-    generated_images = asyncio.run(_generate_images_parallel(prompts, version, seed, workers))
+    # Frame each image for print as soon as it is ready, overlapping the API calls
+    framed = {}
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as frame_pool:
+        def frame_when_ready(image_path: Path) -> None:
+            if image_path not in framed:
+                framed[image_path] = frame_pool.submit(_frame_for_pdf, image_path)
 
-    print()
-    print("=" * 60)
-    print("Creating PDFs...")
-    print("Framing images for print...")
+        # Save prompts, generate images (manifest updated as each completes) and write books
+        generated_images, pdf_paths = asyncio.run(
+            _run_pipeline(prompts, version, seed, workers, books, framed, frame_when_ready))
 
     succeeded = len(generated_images)
     failed = len(prompts) - succeeded
 
+    print()
+    print("=" * 60)
     if character_id == 'all':
-        # Create per-character PDFs
-        pdf_paths = _create_character_pdfs(generated_images, version)
-        print()
-        print("=" * 60)
         print(f"Generation complete: {succeeded}/{len(prompts)} pages succeeded, {len(pdf_paths)} books")
         if failed > 0:
             print(f"WARNING: {failed} page(s) failed to generate and are missing from PDFs")
         return pdf_paths
-    else:
-        # Single character PDF
-        version_path = versioning.get_version_path(version)
-        version_path.mkdir(parents=True, exist_ok=True)
-        pdf_path = version_path / f'{character_id}-book.pdf'
-
-        # Sort images by page stem
-        sorted_images = sorted(generated_images.items(), key=lambda x: x[0])
-        image_paths = [img for _, img in sorted_images]
 
-        print(f"Creating PDF with {len(image_paths)} page(s)...")
-        _create_pdf_from_images(image_paths, pdf_path)
-        print(f"Saved book to: {pdf_path}")
-
-        # Update manifest with book info
-        versioning.update_manifest_book(version, pdf_path.name)
-
-        print()
-        print("=" * 60)
-        print(f"Generation complete: {succeeded}/{len(prompts)} pages succeeded")
-        if failed > 0:
-            print(f"WARNING: {failed} page(s) failed to generate and are missing from PDF")
-
-        return pdf_path
+    print(f"Generation complete: {succeeded}/{len(prompts)} pages succeeded")
+    if failed > 0:
+        print(f"WARNING: {failed} page(s) failed to generate and are missing from PDF")
+    return books[0][1]
 
 
 def main():
@@ -477,7 +840,7 @@ Default style: {default_style}
     parser.add_argument("--style", default=default_style, help=f"The visual style to use (default: {default_style})")
     parser.add_argument("--message", "-m", help="Commit message for a new version (required if prompts changed)")
     parser.add_argument("--seed", type=int, help="Seed for reproducible generation")
-    parser.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS, help=f"Number of concurrent workers (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--workers", "--jobs", "-w", "-j", type=int, default=DEFAULT_WORKERS, help=f"Number of concurrent workers (default: {DEFAULT_WORKERS})")
 
     args = parser.parse_args()
 
@@ -488,14 +851,14 @@ Default style: {default_style}
     workers = args.workers
 
     # Validate character_id format (lowercase, underscores allowed, or "all")
-    if character_id != 'all' and not re.match(r'^[a-z_]+$', character_id):
+    if character_id != 'all' and not ID_PATTERN.match(character_id):
         parser.error(
             f"Invalid character ID '{character_id}'. "
             "Character IDs should be lowercase letters and underscores only (or 'all')"
         )
 
     # Validate style_id format (lowercase, underscores allowed)
-    if not re.match(r'^[a-z_]+$', style_id):
+    if not ID_PATTERN.match(style_id):
         parser.error(
             f"Invalid style ID '{style_id}'. "
             "Style IDs should be lowercase letters and underscores only"
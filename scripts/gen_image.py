@@ -30,6 +30,7 @@ import time
 import asyncio
 import argparse
 import yaml
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path so we can import from scripts package
@@ -40,6 +41,12 @@ from google.genai import types
 from google.genai.errors import ClientError
 from PIL import Image
 
+# Use the libyaml C loader when available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Public API
 __all__ = ["build_prompt", "generate_image", "generate_image_from_prompt", "generate_image_from_prompt_async", "show_prompt", "frame_image", "frame_image_for_pdf", "get_default_style"]
 
@@ -78,8 +85,16 @@ RETRY_BACKOFF_MULTIPLIER = 1.5    # 1.5x wait time each retry (5th attempt waits
 
 def _load_yaml_file(file_path):
     """Load and parse a YAML file."""
-    with open(file_path, "r") as f:
-        return yaml.safe_load(f)
+    return yaml.load(Path(file_path).read_bytes(), Loader=SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def _load_shared_yaml(file_path):
+    """Load a YAML file shared across pages (style, template, character, location).
+
+    Parsed once per process and memoized; callers must treat the result as read-only.
+    """
+    return _load_yaml_file(file_path)
 
 
 def get_default_style():
@@ -91,7 +106,7 @@ def get_default_style():
     Raises:
         ValueError: If no default_style is defined in template.yaml
     """
-    template = _load_yaml_file("story/template.yaml")
+    template = _load_shared_yaml("story/template.yaml")
     default_style = template.get("default_style")
     if not default_style:
         raise ValueError("No default_style defined in story/template.yaml")
@@ -110,7 +125,7 @@ def _load_style(style_id):
     Raises:
         ValueError: If style_id is not found in styles.yaml
     """
-    styles = _load_yaml_file("story/styles.yaml")
+    styles = _load_shared_yaml("story/styles.yaml")
     if style_id not in styles:
         available = list(styles.keys())
         raise ValueError(f"Unknown style '{style_id}'. Available: {available}")
@@ -123,7 +138,7 @@ def _load_template_setting():
     This provides story-specific setting info (house, atmosphere, etc.)
     that is combined with the style-specific visual prompts.
     """
-    template = _load_yaml_file("story/template.yaml")
+    template = _load_shared_yaml("story/template.yaml")
     return template.get("visual", [])
 
 
@@ -133,7 +148,7 @@ def _load_character_visual(character_id):
     if not char_file.exists():
         return []
 
-    char_data = _load_yaml_file(char_file)
+    char_data = _load_shared_yaml(char_file)
     return char_data.get("visual", [])
 
 
@@ -143,7 +158,7 @@ def _load_location_visual(location_id):
     if not loc_file.exists():
         return []
 
-    loc_data = _load_yaml_file(loc_file)
+    loc_data = _load_shared_yaml(loc_file)
     return loc_data.get("visual", [])
 
 
@@ -179,7 +194,7 @@ def _collect_reference_images(page_data, style_id):
             # Extract the display name and hair from the character YAML
             char_file = Path("characters") / f"{char_id}.yaml"
             if char_file.exists():
-                char_data = _load_yaml_file(char_file)
+                char_data = _load_shared_yaml(char_file)
                 char_name = char_data.get("name", char_id.title())
                 char_hair = char_data.get("hair", "")
             else:
@@ -200,7 +215,7 @@ def _collect_reference_images(page_data, style_id):
             # Extract the display name from the location YAML
             loc_file = Path("locations") / f"{location}.yaml"
             if loc_file.exists():
-                loc_data = _load_yaml_file(loc_file)
+                loc_data = _load_shared_yaml(loc_file)
                 loc_name = loc_data.get(
                     "display_name", location.replace("_", " ").title()
                 )
@@ -257,7 +272,7 @@ def build_prompt(page_data, style_id):
             # Get character name, age, and hair
             char_file = Path("characters") / f"{char_id}.yaml"
             if char_file.exists():
-                char_data = _load_yaml_file(char_file)
+                char_data = _load_shared_yaml(char_file)
                 char_name = char_data.get("name", char_id.title())
                 char_age = char_data.get("age")
                 char_hair = char_data.get("hair", "")
@@ -309,7 +324,7 @@ def build_prompt(page_data, style_id):
         if loc_visual:
             loc_file = Path("locations") / f"{location}.yaml"
             if loc_file.exists():
-                loc_data = _load_yaml_file(loc_file)
+                loc_data = _load_shared_yaml(loc_file)
                 loc_name = loc_data.get(
                     "display_name", location.replace("_", " ").title()
                 )
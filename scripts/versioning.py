@@ -13,6 +13,12 @@ from pathlib import Path
 
 import yaml
 
+# Use the libyaml C loader when available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Module-level lock for thread-safe manifest updates
 _manifest_lock = threading.Lock()
 
@@ -30,7 +36,9 @@ __all__ = [
     'get_git_commit',
     'create_new_version',
     'update_manifest_image',
+    'update_manifest_images',
     'update_manifest_book',
+    'update_manifest_books',
 ]
 
 OUT_DIR = Path('out')
@@ -84,7 +92,8 @@ def compute_prompt_hash(prompt: str, seed: int | None = None, ref_images: list[s
     if ref_images:
         # Sort to ensure consistent ordering
         content = f"{content}|refs={','.join(sorted(ref_images))}"
-    return hashlib.sha256(content.encode()).hexdigest()[:5]
+    # Not a security use; the digest must stay SHA-256 since it names cached images
+    return hashlib.sha256(content.encode(), usedforsecurity=False).hexdigest()[:5]
 
 
 def get_prompt_path(page_stem: str, prompt_hash: str) -> Path:
@@ -157,8 +166,7 @@ def read_manifest(version: int) -> dict | None:
     if not manifest_path.exists():
         return None
 
-    with open(manifest_path) as f:
-        return yaml.safe_load(f)
+    return yaml.load(manifest_path.read_bytes(), Loader=SafeLoader)
 
 
 def write_manifest(version: int, data: dict) -> None:
@@ -203,27 +211,50 @@ def create_new_version(message: str, style: str) -> int:
 
 def update_manifest_image(version: int, page_stem: str, filename: str, prompt_hash: str) -> None:
     """Add or update an image entry in the manifest (thread-safe)."""
+    update_manifest_images(version, [(page_stem, filename, prompt_hash)])
+
+
+def update_manifest_images(version: int, entries: list[tuple[str, str, str]]) -> None:
+    """Add or update several image entries with one manifest read and write (thread-safe).
+
+    Args:
+        version: The version number
+        entries: (page_stem, filename, prompt_hash) tuples
+    """
+    if not entries:
+        return
+
     with _manifest_lock:
         manifest = read_manifest(version)
         if manifest is None:
             raise ValueError(f"No manifest found for version {version}")
 
-        manifest['images'][page_stem] = {
-            'file': filename,
-            'prompt_hash': prompt_hash,
-        }
+        for page_stem, filename, prompt_hash in entries:
+            manifest['images'][page_stem] = {
+                'file': filename,
+                'prompt_hash': prompt_hash,
+            }
 
         write_manifest(version, manifest)
 
 
 def update_manifest_book(version: int, book_filename: str) -> None:
     """Add a book to the manifest if not already present (thread-safe)."""
+    update_manifest_books(version, [book_filename])
+
+
+def update_manifest_books(version: int, book_filenames: list[str]) -> None:
+    """Add several books with one manifest read and write, skipping ones already present (thread-safe)."""
+    if not book_filenames:
+        return
+
     with _manifest_lock:
         manifest = read_manifest(version)
         if manifest is None:
             raise ValueError(f"No manifest found for version {version}")
 
-        if book_filename not in manifest['books']:
-            manifest['books'].append(book_filename)
+        for book_filename in book_filenames:
+            if book_filename not in manifest['books']:
+                manifest['books'].append(book_filename)
 
         write_manifest(version, manifest)
@@ -0,0 +1,13 @@
+"""Tests for descriptor parsing in scripts/analyze_styles.py."""
+
+from scripts.analyze_styles import _parse_descriptors
+
+
+def test_parse_descriptors_skips_empty_bullets():
+    assert _parse_descriptors("- bold lines\n-\n- soft wash") == ['bold lines', 'soft wash']
+    assert _parse_descriptors("1.\n2. muted palette") == ['muted palette']
+
+
+def test_parse_descriptors_numbered_and_symbol_bullets():
+    text = "Here are the descriptors:\n1. ink outlines  \n2) flat color\n* paper grain\n• long shadows\n"
+    assert _parse_descriptors(text) == ['ink outlines', 'flat color', 'paper grain', 'long shadows']
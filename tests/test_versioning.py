@@ -0,0 +1,39 @@
+"""Tests for manifest reading and writing in scripts/versioning.py."""
+
+from scripts import versioning
+
+
+def test_read_manifest_returns_contents_of_latest_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(versioning, 'VERSIONS_DIR', tmp_path)
+
+    version = versioning.create_new_version('first', 'genealogy_witch')
+    assert versioning.read_manifest(version)['images'] == {}
+
+    versioning.update_manifest_image(version, 'p01-arthur', 'p01-arthur-abcde.jpg', 'abcde')
+    versioning.update_manifest_book(version, 'arthur-book.pdf')
+
+    manifest = versioning.read_manifest(version)
+    assert manifest['images'] == {'p01-arthur': {'file': 'p01-arthur-abcde.jpg', 'prompt_hash': 'abcde'}}
+    assert manifest['books'] == ['arthur-book.pdf']
+
+
+def test_batched_updates_write_every_entry_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(versioning, 'VERSIONS_DIR', tmp_path)
+    version = versioning.create_new_version('first', 'genealogy_witch')
+
+    versioning.update_manifest_images(version, [
+        ('p01-arthur', 'p01-arthur-abcde.jpg', 'abcde'),
+        ('p02-emer', 'p02-emer-12345.jpg', '12345'),
+    ])
+    versioning.update_manifest_books(version, ['arthur-book.pdf', 'emer-book.pdf'])
+    versioning.update_manifest_books(version, ['emer-book.pdf'])
+
+    manifest = versioning.read_manifest(version)
+    assert manifest['images']['p02-emer'] == {'file': 'p02-emer-12345.jpg', 'prompt_hash': '12345'}
+    assert list(manifest['images']) == ['p01-arthur', 'p02-emer']
+    assert manifest['books'] == ['arthur-book.pdf', 'emer-book.pdf']
+
+
+def test_read_manifest_missing_version(tmp_path, monkeypatch):
+    monkeypatch.setattr(versioning, 'VERSIONS_DIR', tmp_path)
+    assert versioning.read_manifest(1) is None